@@ -1,4 +1,6 @@
-import queue
+from collections import deque
+from typing import Deque
+
 import numpy as np
 
 # This file was stolen from daphbot_due
@@ -40,10 +42,11 @@ else:
 
 class AudioStreamPlayer:
     def __init__(self):
-        # Audio playback setup
-        self.audio_queue: queue.Queue[np.ndarray] = queue.Queue(
-            maxsize=5
-        )  # Small buffer for low latency
+        # Audio playback setup.  Small buffer for low latency; appending to a
+        # full deque drops the oldest frame.  deque append/popleft are atomic,
+        # so the audio callback never waits on a lock held by the asyncio
+        # thread.
+        self.audio_queue: Deque[np.ndarray] = deque(maxlen=5)
         self.audio_stream = None
         self.audio_thread = None
 
@@ -83,7 +86,7 @@ class AudioStreamPlayer:
 
         try:
             # Get audio data from queue
-            audio_data = self.audio_queue.get_nowait()
+            audio_data = self.audio_queue.popleft()
 
             # Ensure data fits in output buffer - reshape for stereo output
             if len(audio_data) <= len(outdata) * 2:
@@ -99,7 +102,7 @@ class AudioStreamPlayer:
                 needed_samples = len(outdata) * 2
                 outdata[:] = audio_data[:needed_samples].reshape(-1, 2)
 
-        except queue.Empty:
+        except IndexError:
             # No audio data available, output silence
             outdata.fill(0)
         except Exception as e:
@@ -109,19 +112,11 @@ class AudioStreamPlayer:
     def queue_audio_frame(self, frame):
         """Convert and queue audio frame for playback."""
         try:
-            # Convert WebRTC frame to numpy array
-            audio_data = np.frombuffer(frame.to_ndarray().tobytes(), dtype=np.int16)
-
-            # Add to queue (drop old frames if queue is full)
-            try:
-                self.audio_queue.put_nowait(audio_data)
-            except queue.Full:
-                # Remove oldest frame and add new one
-                try:
-                    self.audio_queue.get_nowait()
-                    self.audio_queue.put_nowait(audio_data)
-                except queue.Empty:
-                    pass
+            # Convert WebRTC frame to a flat int16 view of its samples
+            audio_data = frame.to_ndarray().ravel().view(np.int16)
+
+            # Add to queue (drops the oldest frame if the queue is full)
+            self.audio_queue.append(audio_data)
 
         except Exception as e:
             log.error(f"Error queuing audio frame: {e}")
@@ -136,11 +131,7 @@ class AudioStreamPlayer:
                 log.info("Audio stream cleaned up")
 
             # Clear audio queue
-            while not self.audio_queue.empty():
-                try:
-                    self.audio_queue.get_nowait()
-                except queue.Empty:
-                    break
+            self.audio_queue.clear()
 
         except Exception as e:
             log.error(f"Error cleaning up audio stream: {e}")
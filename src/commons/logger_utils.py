@@ -1,10 +1,51 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s: %(levelname)s: %(name)s: %(message)s"
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _configure_root_logger(level: int):
+    """
+    Configure the root logger once, like logging.basicConfig, but hand records
+    to a background QueueListener so the stream write (and its lock) happens
+    off the calling thread, which is usually the asyncio event loop.
+
+    The LOG_LEVEL environment variable (e.g. WARNING in production) overrides
+    the level passed by the first caller.  An unknown LOG_LEVEL falls back to
+    that level with a warning.
+    """
+    global _queue_listener
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    env_level = os.getenv("LOG_LEVEL", "").upper()
+    try:
+        root.setLevel(env_level or level)
+    except ValueError:
+        root.setLevel(level)
+        root.warning(
+            "Ignoring unknown LOG_LEVEL %r, using %s",
+            env_level,
+            logging.getLevelName(level),
+        )
 
 
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Helper function to get a logger with the specified name and standard formatting"""
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s: %(levelname)s: %(name)s: %(message)s",
-    )
+    _configure_root_logger(level)
     return logging.getLogger(name)
@@ -87,6 +87,12 @@ class PortalbotWebSocketClient:
         message_type = message.get("type")
         data = message.get("data", {})
 
+        # The server merges queued messages into one batch frame
+        if message_type == "batch":
+            for batched_message in data:
+                await self.handle_message(batched_message)
+            return
+
         logger.info(f"Received from public server: {message_type}")
 
         # Handle connection acknowledgment
@@ -5,6 +5,7 @@ Manages robot authentication secrets stored in separate key files.
 Each robot has a unique ID and a corresponding secret key file in robot_secrets/<robot-id>.key
 """
 
+import hmac
 import os
 from pathlib import Path
 from typing import Dict, Optional
@@ -110,9 +111,10 @@ class RobotSecrets:
             True if credentials are valid, False otherwise
         """
         stored_secret = self.get_secret(robot_id)
-        if stored_secret is None:
+        if stored_secret is None or not isinstance(secret_key, str):
             return False
-        return stored_secret == secret_key
+        # Constant-time compare so response timing doesn't leak the key
+        return hmac.compare_digest(stored_secret.encode(), secret_key.encode())
 
     def robot_has_access_to_space(
         self, robot_id: str, space_allowed_robots: list
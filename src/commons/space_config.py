@@ -5,11 +5,21 @@ Loads and validates space definitions from portalbot_spaces.yml.
 """
 
 import os
-from typing import List, Optional, Dict
+import re
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+
+# Parse with the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Space and robot IDs: alphanumeric characters, hyphens, and underscores
+ID_RE = re.compile(r"[\w-]+")
 
 
 class SpaceConfig(BaseModel):
@@ -36,8 +46,7 @@ class SpaceConfig(BaseModel):
         """Validate space ID format"""
         if not v or not v.strip():
             raise ValueError("Space ID cannot be empty")
-        # Allow alphanumeric, hyphens, and underscores
-        if not all(c.isalnum() or c in "-_" for c in v):
+        if not ID_RE.fullmatch(v):
             raise ValueError(
                 "Space ID must contain only alphanumeric characters, hyphens, and underscores"
             )
@@ -50,8 +59,7 @@ class SpaceConfig(BaseModel):
         for robot_id in v:
             if not robot_id or not robot_id.strip():
                 raise ValueError("Robot ID cannot be empty")
-            # Allow alphanumeric, hyphens, and underscores
-            if not all(c.isalnum() or c in "-_" for c in robot_id):
+            if not ID_RE.fullmatch(robot_id):
                 raise ValueError(
                     f"Robot ID '{robot_id}' must contain only alphanumeric characters, hyphens, and underscores"
                 )
@@ -67,14 +75,19 @@ class SpacesConfiguration(BaseModel):
     )
     spaces: List[SpaceConfig] = Field(..., description="List of available spaces")
 
-    @field_validator("spaces")
-    @classmethod
-    def validate_unique_ids(cls, v: List[SpaceConfig]) -> List[SpaceConfig]:
-        """Ensure all space IDs are unique"""
-        space_ids = [space.id for space in v]
-        if len(space_ids) != len(set(space_ids)):
+    # space ID -> space, for get_space_by_id
+    _spaces_by_id: Dict[str, SpaceConfig] = PrivateAttr(default_factory=dict)
+    # Enabled spaces, for get_enabled_spaces
+    _enabled_spaces: Tuple[SpaceConfig, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="after")
+    def index_spaces(self) -> "SpacesConfiguration":
+        """Index spaces by ID, ensuring all space IDs are unique"""
+        self._spaces_by_id = {space.id: space for space in self.spaces}
+        if len(self._spaces_by_id) != len(self.spaces):
             raise ValueError("Space IDs must be unique")
-        return v
+        self._enabled_spaces = tuple(space for space in self.spaces if space.enabled)
+        return self
 
     def get_space_by_id(self, space_id: str) -> Optional[SpaceConfig]:
         """
@@ -86,19 +99,16 @@ class SpacesConfiguration(BaseModel):
         Returns:
             SpaceConfig if found, None otherwise
         """
-        for space in self.spaces:
-            if space.id == space_id:
-                return space
-        return None
+        return self._spaces_by_id.get(space_id)
 
-    def get_enabled_spaces(self) -> List[SpaceConfig]:
+    def get_enabled_spaces(self) -> Tuple[SpaceConfig, ...]:
         """
-        Get list of enabled spaces.
+        Get the enabled spaces.
 
         Returns:
-            List of enabled spaces
+            Tuple of enabled spaces, computed when the configuration is loaded
         """
-        return [space for space in self.spaces if space.enabled]
+        return self._enabled_spaces
 
     def to_dict(self) -> Dict:
         """
@@ -149,9 +159,25 @@ def load_spaces_config(config_path: Optional[str] = None) -> SpacesConfiguration
             "Please create portalbot_spaces.yml in the project root."
         )
 
+    with open(config_path, "r") as f:
+        return parse_spaces_config(f.read())
+
+
+def parse_spaces_config(config_text: str) -> SpacesConfiguration:
+    """
+    Parse and validate space configuration from YAML text.
+
+    Args:
+        config_text: Contents of a portalbot_spaces.yml file
+
+    Returns:
+        Validated SpacesConfiguration object
+
+    Raises:
+        ValueError: If configuration is invalid
+    """
     try:
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        config_data = yaml.load(config_text, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in configuration file: {e}")
 
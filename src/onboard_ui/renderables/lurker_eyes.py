@@ -1,7 +1,16 @@
-import time
-import numpy as np
+import math
+from typing import List, Optional, Tuple
+
 import pygame
 
+BACKGROUND_COLOR = (20, 20, 40)
+SCLERA_COLOR = (255, 255, 255)
+PUPIL_COLOR = (20, 20, 40)
+
+EYE_DISTANCE = 150
+EYE_RADIUS = 60
+PUPIL_RADIUS = 30
+
 
 class LurkerEyes:
     """
@@ -14,49 +23,73 @@ class LurkerEyes:
         self.screen = screen
         self.display_size = 1080
 
+        # The eyes don't move, only the pupils do
+        center_x = self.display_size // 2
+        center_y = self.display_size // 2
+        self.eye_centers = (
+            (center_x - EYE_DISTANCE, center_y),
+            (center_x + EYE_DISTANCE, center_y),
+        )
+        # Screen areas that can change between frames
+        self.eye_rects = [
+            pygame.Rect(
+                eye_x - EYE_RADIUS, eye_y - EYE_RADIUS, 2 * EYE_RADIUS, 2 * EYE_RADIUS
+            )
+            for eye_x, eye_y in self.eye_centers
+        ]
+        self.background: Optional[pygame.Surface] = None
+        # Pupil offset currently on screen, None when the screen needs a full
+        # redraw (e.g. another renderable drew in between)
+        self.pupil_offset: Optional[Tuple[int, int]] = None
+        # Screen areas changed by the last render() that returned True
+        self.dirty_rects: List[pygame.Rect] = []
+
+    def reset(self):
+        """Force a full redraw on the next render()"""
+        self.pupil_offset = None
+
+    def get_background(self) -> pygame.Surface:
+        """Background with both (pupil-less) eyes, drawn once and then reused"""
+        if self.background is None:
+            background = pygame.Surface(self.screen.get_size())
+            background.fill(BACKGROUND_COLOR)
+            for eye_center in self.eye_centers:
+                pygame.draw.circle(background, SCLERA_COLOR, eye_center, EYE_RADIUS)
+            self.background = background.convert()
+        return self.background
+
     def render(self, t: float) -> bool:
-        """Draw animated robot eyes when idle"""
+        """
+        Draw animated robot eyes when idle.  Returns False, without drawing,
+        when the pupils haven't moved since the last frame; otherwise the
+        changed screen areas are left in dirty_rects.
+        """
         if not self.screen:
             return False
 
-        # Simple animated eyes
-        center_x = self.display_size // 2
-        center_y = self.display_size // 2
-        eye_distance = 150
-        eye_radius = 60
-        pupil_radius = 30
-
         # Animate pupil position with time
-        t = time.time()
-        pupil_offset_x = int(20 * np.sin(t * 0.5))
-        pupil_offset_y = int(20 * np.cos(t * 0.7))
-
-        # Left eye
-        pygame.draw.circle(
-            self.screen,
-            (255, 255, 255),
-            (center_x - eye_distance, center_y),
-            eye_radius,
-        )
-        pygame.draw.circle(
-            self.screen,
-            (20, 20, 40),
-            (center_x - eye_distance + pupil_offset_x, center_y + pupil_offset_y),
-            pupil_radius,
-        )
+        pupil_offset_x = int(20 * math.sin(t * 0.5))
+        pupil_offset_y = int(20 * math.cos(t * 0.7))
+        if (pupil_offset_x, pupil_offset_y) == self.pupil_offset:
+            return False
 
-        # Right eye
-        pygame.draw.circle(
-            self.screen,
-            (255, 255, 255),
-            (center_x + eye_distance, center_y),
-            eye_radius,
-        )
-        pygame.draw.circle(
-            self.screen,
-            (20, 20, 40),
-            (center_x + eye_distance + pupil_offset_x, center_y + pupil_offset_y),
-            pupil_radius,
-        )
+        background = self.get_background()
+        if self.pupil_offset is None:
+            self.screen.blit(background, (0, 0))
+            self.dirty_rects = [self.screen.get_rect()]
+        else:
+            # Pupils never leave the sclera, so only the eyes need redrawing
+            for eye_rect in self.eye_rects:
+                self.screen.blit(background, eye_rect, area=eye_rect)
+            self.dirty_rects = self.eye_rects
+        self.pupil_offset = (pupil_offset_x, pupil_offset_y)
+
+        for eye_x, eye_y in self.eye_centers:
+            pygame.draw.circle(
+                self.screen,
+                PUPIL_COLOR,
+                (eye_x + pupil_offset_x, eye_y + pupil_offset_y),
+                PUPIL_RADIUS,
+            )
 
         return True
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
+import functools
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 
 import cv2
@@ -10,23 +11,55 @@ import pygame
 
 logger = logging.getLogger(__name__)
 
+# Face detection runs on a copy of the frame scaled down to this width; the
+# detected boxes are scaled back up to crop the full resolution frame.
+DETECTION_WIDTH = 320
+MIN_FACE_SIZE = 100
+
+
+def _reuse_buffer(buffer: Optional[np.ndarray], shape: tuple) -> np.ndarray:
+    """Return buffer if it already has the given shape, else a new uint8 array"""
+    if buffer is None or buffer.shape != shape:
+        return np.empty(shape, dtype=np.uint8)
+    return buffer
+
 
 class RemoteFace:
     """Manages the robot's pygame display and rendering"""
 
     def __init__(
-        self, screen: pygame.Surface, display_size: int = 1080, face_cascade=None
+        self,
+        screen: pygame.Surface,
+        display_size: int = 1080,
+        face_cascade_loader: Optional[Callable] = None,
     ):
         """
         Initialize the robot display.
 
         Args:
             display_size: Size of the square display (width and height)
-            face_cascade: OpenCV cascade classifier for face detection
+            face_cascade_loader: Returns the OpenCV cascade classifier for face
+                detection. Called on first use, not at startup.
         """
         self.display_size = display_size
-        self.face_cascade = face_cascade
+        self.face_cascade_loader = face_cascade_loader
         self.screen = screen
+        # Reused as the cv2.resize destination so each frame doesn't allocate
+        # a new display_size x display_size RGB array.
+        self.display_buffer = np.empty((display_size, display_size, 3), dtype=np.uint8)
+        # Same for the face detection intermediates; (re)allocated whenever
+        # the incoming frame size changes.
+        self.detection_buffer: Optional[np.ndarray] = None
+        self.gray_buffer: Optional[np.ndarray] = None
+        # Destination for the yuv420p -> RGB conversion of each frame
+        self.rgb_buffer: Optional[np.ndarray] = None
+
+    @functools.cached_property
+    def face_cascade(self):
+        """Face detector, loaded the first time remote video is rendered"""
+        if self.face_cascade_loader is None:
+            return None
+        return self.face_cascade_loader()
 
     def render(self, _t: float, frame: np.ndarray) -> bool:
         """Draw remote operator's video on display"""
@@ -36,8 +69,12 @@ class RemoteFace:
         try:
             rgb_frame = self.normalize_to_rgb(frame)
 
+            # The Y plane at the top of a yuv420p frame is already grayscale,
+            # so detect faces on it instead of converting the RGB frame back.
+            luma = frame[: rgb_frame.shape[0]] if frame.ndim == 2 else None
+
             # Detect and extract the largest face
-            face_frame = self.extract_largest_face(rgb_frame)
+            face_frame = self.extract_largest_face(rgb_frame, luma)
 
             if face_frame is not None:
                 display_frame = face_frame
@@ -47,15 +84,15 @@ class RemoteFace:
 
             # Resize to fit display (square)
             display_frame = cv2.resize(
-                display_frame, (self.display_size, self.display_size)
+                display_frame,
+                (self.display_size, self.display_size),
+                dst=self.display_buffer,
             )
 
-            # Convert to pygame surface
-            display_frame = np.rot90(display_frame)
-            surface = pygame.surfarray.make_surface(display_frame)
-
-            # Draw to screen
-            self.screen.blit(surface, (0, 0))
+            # Write the pixels straight into the (display_size square) screen
+            # surface rather than building a new Surface each frame and
+            # blitting it.  rot90 is a strided view, not a copy.
+            pygame.surfarray.blit_array(self.screen, np.rot90(display_frame))
             pygame.display.flip()
 
         except Exception as e:
@@ -71,7 +108,10 @@ class RemoteFace:
 
         # aiortc/pyav yuv420p frame layout as a single 2D array.
         if frame.ndim == 2:
-            return cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_I420)
+            self.rgb_buffer = _reuse_buffer(
+                self.rgb_buffer, (frame.shape[0] * 2 // 3, frame.shape[1], 3)
+            )
+            return cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_I420, dst=self.rgb_buffer)
 
         # 3-channel arrays are treated as already displayable RGB.
         if frame.ndim == 3 and frame.shape[2] == 3:
@@ -79,23 +119,51 @@ class RemoteFace:
 
         raise ValueError(f"Unsupported frame shape: {frame.shape}")
 
-    def extract_largest_face(self, frame: np.ndarray) -> Optional[np.ndarray]:
+    def detect_faces(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Detect faces in an RGB or grayscale frame.  Returns (x, y, w, h)
+        boxes in the frame's own coordinates.
+        """
+        height, width = frame.shape[:2]
+        scale = min(1.0, DETECTION_WIDTH / width)
+        if scale < 1.0:
+            size = (round(width * scale), round(height * scale))
+            self.detection_buffer = _reuse_buffer(
+                self.detection_buffer, (size[1], size[0]) + frame.shape[2:]
+            )
+            frame = cv2.resize(
+                frame, size, dst=self.detection_buffer, interpolation=cv2.INTER_AREA
+            )
+
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            self.gray_buffer = _reuse_buffer(self.gray_buffer, frame.shape[:2])
+            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY, dst=self.gray_buffer)
+        min_size = int(MIN_FACE_SIZE * scale)
+        faces = self.face_cascade.detectMultiScale(
+            gray, scaleFactor=1.1, minNeighbors=5, minSize=(min_size, min_size)
+        )
+
+        if len(faces) == 0 or scale == 1.0:
+            return faces
+        return (np.asarray(faces) / scale).astype(int)
+
+    def extract_largest_face(
+        self, frame: np.ndarray, detect_frame: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
         """
         Extract the largest detected face from the frame.
         Returns None if no face is detected.
+
+        If given, faces are detected in detect_frame (e.g. a grayscale copy
+        of the same size) instead of frame.
         """
         if self.face_cascade is None or frame is None:
             return None
 
         try:
-            # Convert to grayscale for detection
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-
-            # Detect faces
-            faces = self.face_cascade.detectMultiScale(
-                gray, scaleFactor=1.1, minNeighbors=5, minSize=(100, 100)
-            )
-
+            faces = self.detect_faces(frame if detect_frame is None else detect_frame)
             if len(faces) == 0:
                 return None
 
@@ -124,11 +192,7 @@ class RemoteFace:
             return True
 
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-            faces = self.face_cascade.detectMultiScale(
-                gray, scaleFactor=1.1, minNeighbors=5, minSize=(100, 100)
-            )
-            return len(faces) > 0
+            return len(self.detect_faces(frame)) > 0
         except Exception as e:
             logger.error(f"Error detecting face: {e}")
             return True  # Fail open
@@ -13,7 +13,7 @@ import logging
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 import pygame
@@ -34,20 +34,27 @@ logger = logging.getLogger(__name__)
 class RobotDisplay:
     """Manages the robot's pygame display and rendering"""
 
-    def __init__(self, display_size: int = 1080, face_cascade=None):
+    def __init__(
+        self, display_size: int = 1080, face_cascade_loader: Optional[Callable] = None
+    ):
         """
         Initialize the robot display.
 
         Args:
             display_size: Size of the square display (width and height)
-            face_cascade: OpenCV cascade classifier for face detection
+            face_cascade_loader: Returns the OpenCV cascade classifier for face
+                detection. Only called once remote video needs it.
         """
         self.display_size = display_size
-        self.face_cascade = face_cascade
+        self.face_cascade_loader = face_cascade_loader
         self.screen: Optional[pygame.Surface] = None
         self.lurker_eyes: Optional[LurkerEyes] = None
         self.sleeping_eyes: Optional[SleepingEyes] = None
         self.remote_face: Optional[RemoteFace] = None
+        # Renderable drawn by the previous frame
+        self.last_renderable: Optional[object] = None
+        # Remote video frame drawn most recently
+        self.last_video_frame: Optional[np.ndarray] = None
 
     def init_pygame(self, window_title: str = "Portalbot"):
         """Initialize pygame display"""
@@ -66,7 +73,7 @@ class RobotDisplay:
             self.remote_face = RemoteFace(
                 self.screen,
                 display_size=self.display_size,
-                face_cascade=self.face_cascade,
+                face_cascade_loader=self.face_cascade_loader,
             )
 
         except Exception as e:
@@ -78,12 +85,16 @@ class RobotDisplay:
         if not self.screen:
             return
 
-        # Fill background
-        self.screen.fill((20, 20, 40))
-        if self.lurker_eyes:
-            self.lurker_eyes.render(time.time())
+        if not self.lurker_eyes:
+            return
 
-        pygame.display.flip()
+        # The lurker eyes blit their own cached background and only redraw
+        # the eyes once they are on screen
+        if self.last_renderable is not self.lurker_eyes:
+            self.lurker_eyes.reset()
+            self.last_renderable = self.lurker_eyes
+        if self.lurker_eyes.render(time.time()):
+            pygame.display.update(self.lurker_eyes.dirty_rects)
 
     def draw_sleeping_eyes(self):
         """Draw animated robot eyes when idle"""
@@ -92,6 +103,7 @@ class RobotDisplay:
 
         # Fill background
         self.screen.fill((20, 20, 40))
+        self.last_renderable = self.sleeping_eyes
         if self.sleeping_eyes:
             self.sleeping_eyes.render(time.time())
 
@@ -102,6 +114,14 @@ class RobotDisplay:
         if not self.screen or frame is None or not self.remote_face:
             return
 
+        # The UI loop polls for the newest frame, often faster than video
+        # arrives; a frame that is already on screen needs no conversion,
+        # face detection or flip.  Each received frame is a new array.
+        if frame is self.last_video_frame and self.last_renderable is self.remote_face:
+            return
+
+        self.last_renderable = self.remote_face
+        self.last_video_frame = frame
         self.remote_face.render(time.time(), frame)
 
     def cleanup(self):
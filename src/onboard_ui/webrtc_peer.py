@@ -15,7 +15,9 @@ person granted control of the robot is shown.
 """
 
 import asyncio
-from typing import Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
 
 from aiortc import RTCIceCandidate, RTCPeerConnection, RTCSessionDescription  # type: ignore[import-not-found]
 import numpy as np
@@ -27,11 +29,19 @@ from src.commons.logger_utils import get_logger
 # Configure logging
 logger = get_logger("webrtc_peer")
 
+# "candidate:<foundation> <component> <protocol> <priority> <ip> <port> typ <type> ..."
+ICE_CANDIDATE_RE = re.compile(
+    r"candidate:(?P<foundation>\S+) (?P<component>\d+) (?P<protocol>\S+) "
+    r"(?P<priority>\d+) (?P<ip>\S+) (?P<port>\d+) typ (?P<type>\S+)"
+)
+
 
 class WebRTCPeer:
     """
     Everything related to handling the WebRTC peer connection and tracks
     from the remote human operator is handled in this class.
+
+    Expects to run on the onboard UI service's uvloop event loop.
     """
 
     def __init__(self):
@@ -39,16 +49,26 @@ class WebRTCPeer:
         self.remote_video_frame: Optional[np.ndarray] = None
         self.audio_player = AudioStreamPlayer()
         self.stopping = False
+        # Copies decoded frames out to numpy off the event loop, which also
+        # runs aiortc's ICE/DTLS/RTP handling
+        self.frame_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="webrtc_video_frames"
+        )
+        # Running track processing tasks, so full_stop can wait for them
+        self.track_tasks: Set[asyncio.Task] = set()
 
-    def full_stop(self):
-        """Completely stop the peer connection and clean up resources"""
+    async def full_stop(self):
+        """
+        Completely stop the peer connection and clean up resources.  Must be
+        awaited on the event loop the peer connection was created on.
+        """
         self.stopping = True
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self.close_peer_connection())
-        except RuntimeError:
-            if self.peer_connection:
-                asyncio.run(self.close_peer_connection())
+        await self.close_peer_connection()
+        # Closing the connection ends the tracks; let their tasks finish
+        # before shutting down the executor the video task copies frames on
+        if self.track_tasks:
+            await asyncio.gather(*self.track_tasks, return_exceptions=True)
+        self.frame_executor.shutdown(wait=True)
 
     async def close_peer_connection(self):
         """Close the current peer connection but keep the option to create a new one later"""
@@ -63,33 +83,40 @@ class WebRTCPeer:
         await self.close_peer_connection()
 
         pc = RTCPeerConnection()
-
-        @pc.on("track")
-        def on_track(track):
-            logger.info(f"Received WebRTC track: {track.kind}")
-            if track.kind == "video":
-                asyncio.create_task(self.process_video_track(track))
-            elif track.kind == "audio":
-                asyncio.create_task(self.process_audio_track(track))
-
-        @pc.on("connectionstatechange")
-        async def on_connectionstatechange():
-            state = (
-                self.peer_connection.connectionState
-                if self.peer_connection != None
-                else "null"
-            )
-            logger.info(f"WebRTC connection state: {state}")
-            if state == "failed":
-                logger.warning("WebRTC connection failed, closing peer connection")
-                await self.close_peer_connection()
-            if state == "closed":
-                logger.info("WebRTC connection closed, cleaning up peer connection")
-                await self.close_peer_connection()
+        # Bound methods rather than per-connection closures
+        pc.on("track", self.on_track)
+        pc.on("connectionstatechange", self.on_connectionstatechange)
 
         self.peer_connection = pc
         return pc
 
+    def on_track(self, track):
+        """Start processing a track received from the remote peer"""
+        logger.info(f"Received WebRTC track: {track.kind}")
+        if track.kind == "video":
+            task = asyncio.create_task(self.process_video_track(track))
+        elif track.kind == "audio":
+            task = asyncio.create_task(self.process_audio_track(track))
+        else:
+            return
+        self.track_tasks.add(task)
+        task.add_done_callback(self.track_tasks.discard)
+
+    async def on_connectionstatechange(self):
+        """Tear down the peer connection once it fails or closes"""
+        state = (
+            self.peer_connection.connectionState
+            if self.peer_connection != None
+            else "null"
+        )
+        logger.info(f"WebRTC connection state: {state}")
+        if state == "failed":
+            logger.warning("WebRTC connection failed, closing peer connection")
+            await self.close_peer_connection()
+        if state == "closed":
+            logger.info("WebRTC connection closed, cleaning up peer connection")
+            await self.close_peer_connection()
+
     async def handle_offer(self, offer: dict):
         """
         Handle incoming WebRTC offer from remote human operator.
@@ -100,7 +127,8 @@ class WebRTCPeer:
         Args:
             offer: Dictionary containing the WebRTC offer from remote human
         """
-        logger.info(f"Received WebRTC offer; {offer}")
+        logger.info("Received WebRTC offer")
+        logger.debug("Offer: %s", offer)
 
         pc = await self.create_peer_connection()
         # handle offer
@@ -111,7 +139,8 @@ class WebRTCPeer:
         await pc.setLocalDescription(answer)
 
         self.peer_connection = pc
-        logger.info(f"Created WebRTC answer: {answer}")
+        logger.info("Created WebRTC answer")
+        logger.debug("Answer: %s", answer)
         return answer
 
     async def handle_ice_candidate(self, data: dict):
@@ -125,7 +154,7 @@ class WebRTCPeer:
             logger.warning("Received ICE candidate without candidate data")
             return
 
-        logger.debug(f"Received ICE candidate: {candidate}")
+        logger.debug("Received ICE candidate: %s", candidate)
         if not self.peer_connection:
             logger.warning("Received ICE candidate but no peer connection exists")
             return
@@ -137,18 +166,46 @@ class WebRTCPeer:
         """Process incoming video frames from WebRTC track."""
         logger.info("Starting video track processing")
         frame_count = 0
+        loop = asyncio.get_running_loop()
+        # The connection this track belongs to (tracks arrive while
+        # handle_offer applies the remote description on it)
+        pc = self.peer_connection
         try:
             while not self.stopping:
-                frame = await track.recv()
+                frame = self._latest_decoded_frame(track, await track.recv())
                 # Keep the source pixel format (typically yuv420p) and convert
                 # inside RobotDisplay to avoid swscale rgb24/bgr24 warnings.
-                self.remote_video_frame = frame.to_ndarray()
+                frame_array = await loop.run_in_executor(
+                    self.frame_executor, frame.to_ndarray
+                )
+                # The connection may have been closed or replaced while the
+                # copy ran; don't put its frame back on screen.
+                if self.stopping or self.peer_connection is not pc:
+                    break
+                self.remote_video_frame = frame_array
                 frame_count += 1
-                if (frame_count % 100) == 0:
-                    logger.debug(f"Received 100 frames ({frame_count})")
+                if frame_count % 100 == 0:
+                    logger.debug("Received %d video frames", frame_count)
         except Exception as e:
             logger.error(f"Error processing video track: {e}")
 
+    def _latest_decoded_frame(self, track, frame):
+        """
+        Return the newest frame already decoded for an aiortc remote track,
+        dropping the older ones queued behind frame.  Only the newest frame
+        is ever displayed, so this keeps latency from building up when the
+        loop falls behind.
+        """
+        queue = getattr(track, "_queue", None)
+        while queue is not None and not queue.empty():
+            queued = queue.get_nowait()
+            if queued is None:
+                # End of stream; leave it for the next recv() to raise on
+                queue.put_nowait(None)
+                break
+            frame = queued
+        return frame
+
     async def process_audio_track(self, track):
         """Process incoming audio frames from WebRTC track."""
         try:
@@ -172,23 +229,18 @@ class WebRTCPeer:
             self.audio_player.cleanup_audio_stream()
 
     def create_RTCIceCandidate(self, candidate: dict) -> RTCIceCandidate:
-        parts = candidate["candidate"].split(" ")
-        foundation = parts[0].split(":")[1]
-        component = int(parts[1])
-        protocol = parts[2]
-        priority = int(parts[3])
-        ip = parts[4]
-        port = int(parts[5])
-        type = parts[7]
+        match = ICE_CANDIDATE_RE.search(candidate["candidate"])
+        if not match:
+            raise ValueError(f"Malformed ICE candidate: {candidate['candidate']}")
 
         return RTCIceCandidate(
-            component=component,
-            foundation=foundation,
-            ip=ip,
-            port=port,
-            priority=priority,
-            protocol=protocol,
-            type=type,
+            component=int(match["component"]),
+            foundation=match["foundation"],
+            ip=match["ip"],
+            port=int(match["port"]),
+            priority=int(match["priority"]),
+            protocol=match["protocol"],
+            type=match["type"],
             sdpMid=candidate["sdpMid"],
             sdpMLineIndex=candidate["sdpMLineIndex"],
         )
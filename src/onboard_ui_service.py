@@ -13,12 +13,20 @@ person granted control of the robot is shown.
 - When no one has control, the UI displays an animation of the robot's eyes.
 
 """
+import os
+
+# Keep BLAS/OpenMP from spawning a worker per core on Pi-class boards.  These
+# must be set before numpy (or anything importing it) is loaded.
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "2")
+
 import sys
 from pathlib import Path
 import threading
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import cv2
 from fastapi import FastAPI
 import pygame
 from basic_bot.commons import constants as c
@@ -39,6 +47,10 @@ from src.commons.logger_utils import get_logger
 
 logger = get_logger("onboard_ui_service")
 
+# Leave scheduling headroom for the pygame and asyncio threads; by default
+# OpenCV uses every core for detectMultiScale, resize, cvtColor, etc.
+cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+
 running = True
 ui_worker: Optional[threading.Thread] = None
 
@@ -69,6 +81,9 @@ async def lifespan(_app: FastAPI):
         yield
     finally:
         shutdown()
+        # The peer connection lives on this event loop, so it is closed here
+        # rather than from the UI thread.
+        await webrtc_peer.full_stop()
         if ui_worker and ui_worker.is_alive():
             ui_worker.join(timeout=2)
 
@@ -80,8 +95,7 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-face_cascade = load_face_detector()
-display = RobotDisplay(face_cascade=face_cascade)
+display = RobotDisplay(face_cascade_loader=load_face_detector)
 webrtc_peer: WebRTCPeer = WebRTCPeer()
 
 
@@ -89,7 +103,6 @@ def shutdown():
     """Cleanly shutdown the service"""
     global running
     running = False
-    webrtc_peer.full_stop()
     display.cleanup()
 
 
@@ -151,7 +164,7 @@ async def create_webrtc_offer(data: dict):
 @app.post("/ice_candidate")
 async def receive_ice_candidate(data: dict):
     """Endpoint to receive ICE candidate forwarded from portalbot_service"""
-    logger.info(f"Received ICE candidate from portalbot service: {data}")
+    logger.info("Received ICE candidate from portalbot service: %s", data)
     await webrtc_peer.handle_ice_candidate(data)
     return {"status": "ICE candidate received"}
 
@@ -173,4 +186,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=port,
         log_level="debug" if debug else "info",
+        # aiortc's RTP/DTLS/SCTP handling runs on this loop.  Pin uvloop
+        # rather than relying on "auto" so a missing install fails loudly
+        # instead of silently falling back to the slower selector loop.
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
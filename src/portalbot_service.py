@@ -25,8 +25,8 @@ a local websocket connection.
 """
 
 import asyncio
+import signal
 import sys
-import threading
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -53,6 +53,10 @@ from src.commons.logger_utils import get_logger
 
 logger = get_logger("portalbot_service")
 
+# Servos can't track faster than ~50 Hz, so relayed commands arriving within
+# this window are merged and only the latest values are sent to central_hub.
+HUB_RELAY_COALESCE_SECONDS = 0.02
+
 
 class PortalbotService:
     """Main service for the portalbot robot"""
@@ -65,11 +69,13 @@ class PortalbotService:
         try:
             self.config: RobotConfig = load_robot_config()
             logger.info(
-                f"Loaded robot config: {self.config.robot_id} "
-                f"({self.config.robot_name}) -> {self.config.space_id}"
+                "Loaded robot config: %s (%s) -> %s",
+                self.config.robot_id,
+                self.config.robot_name,
+                self.config.space_id,
             )
         except Exception as e:
-            logger.error(f"Failed to load robot configuration: {e}")
+            logger.error("Failed to load robot configuration: %s", e)
             raise
 
         # Get secret key
@@ -77,11 +83,16 @@ class PortalbotService:
             self.secret_key = self.config.get_secret_key()
             logger.info("Secret key loaded successfully")
         except Exception as e:
-            logger.error(f"Failed to load secret key: {e}")
+            logger.error("Failed to load secret key: %s", e)
             raise
 
         # State management
         self.running = False
+        self._stop_event: Optional[asyncio.Event] = None
+
+        # Commands waiting to be flushed to central_hub (see relay_command_to_hub)
+        self._pending_hub_update: dict = {}
+        self._hub_flush_task: Optional[asyncio.Task] = None
 
         # Initialize control state manager
         self.control_manager = ControlStateManager(
@@ -111,12 +122,40 @@ class PortalbotService:
         await self.ws_client.send_message(message_type, data)
 
     async def relay_command_to_hub(self, data: dict):
-        """Relay command data to central_hub"""
-        if self.hub_monitor and self.hub_monitor.connected_socket:
-            await messages.send_update_state(
-                self.hub_monitor.connected_socket,
-                data,  # Already formatted as {"servo_angles": {"pan": 90, "tilt": 45}}
-            )
+        """
+        Queue command data for central_hub.
+
+        Commands are coalesced for HUB_RELAY_COALESCE_SECONDS so a burst of
+        set_angles messages results in a single hub update carrying the
+        latest value for each servo.
+        """
+        # Already formatted as {"servo_angles": {"pan": 90, "tilt": 45}}
+        for key, value in data.items():
+            pending = self._pending_hub_update.get(key)
+            if isinstance(pending, dict) and isinstance(value, dict):
+                pending.update(value)
+            else:
+                self._pending_hub_update[key] = (
+                    dict(value) if isinstance(value, dict) else value
+                )
+
+        if self._hub_flush_task is None or self._hub_flush_task.done():
+            self._hub_flush_task = asyncio.create_task(self._flush_hub_update())
+
+    async def _flush_hub_update(self):
+        """
+        Send the coalesced hub update after the coalescing window.  Commands
+        that arrive while a send is in flight don't schedule another flush
+        (this task isn't done yet), so keep flushing until none are pending.
+        """
+        while self._pending_hub_update:
+            await asyncio.sleep(HUB_RELAY_COALESCE_SECONDS)
+            update = self._pending_hub_update
+            self._pending_hub_update = {}
+            if update and self.hub_monitor and self.hub_monitor.connected_socket:
+                await messages.send_update_state(
+                    self.hub_monitor.connected_socket, update
+                )
 
     async def send_user_counts_to_hub(self, viewer_count: int):
         """Send user counts to central_hub"""
@@ -148,18 +187,18 @@ class PortalbotService:
     async def handle_vision_answer(self, url: str, sender_id: str, payload: dict):
         """Handle the answer from the vision service and send it to public server"""
 
-        logger.info(f"Received answer from {url}")
+        logger.info("Received answer from %s", url)
 
         answer = payload.get("sdp")
         client_id = payload.get("client_id")
         if client_id:
             self.sender_to_client_id_map[sender_id] = client_id
             logger.debug(
-                f"Mapped sender ID {sender_id} to vision client ID {client_id}"
+                "Mapped sender ID %s to vision client ID %s", sender_id, client_id
             )
 
         if answer:
-            logger.info(f"Received answer from {url}, sending to public server")
+            logger.info("Received answer from %s, sending to public server", url)
             await self.send_to_public_server(
                 "answer",
                 {
@@ -168,7 +207,7 @@ class PortalbotService:
                 },
             )
         else:
-            logger.error(f"Answer from {url} missing 'sdp' field: {payload}")
+            logger.error("Answer from %s missing 'sdp' field: %s", url, payload)
 
     async def handle_control_offer(self, data: dict):
         """
@@ -192,10 +231,10 @@ class PortalbotService:
     async def handle_control_answer(self, url: str, sender_id: str, payload: dict):
         """Handle the answer from the onboard UI service and send it to public server"""
 
-        logger.info(f"Received answer from {url}")
+        logger.info("Received answer from %s", url)
         answer = payload.get("sdp")
         if answer:
-            logger.info(f"Received answer from {url}, sending to public server")
+            logger.info("Received answer from %s, sending to public server", url)
             await self.send_to_public_server(
                 "control_answer",
                 {
@@ -204,7 +243,7 @@ class PortalbotService:
                 },
             )
         else:
-            logger.error(f"Answer from {url} missing 'sdp' field: {payload}")
+            logger.error("Answer from %s missing 'sdp' field: %s", url, payload)
 
     async def forward_offer(
         self,
@@ -222,7 +261,7 @@ class PortalbotService:
         :param offer: Description
         :type offer: str
         """
-        logger.info(f"Relaying WebRTC offer from {sender_id} to {url}")
+        logger.info("Relaying WebRTC offer from %s to %s", sender_id, url)
 
         try:
             if not self.http_session:
@@ -233,23 +272,25 @@ class PortalbotService:
             async with self.http_session.post(url, json=payload) as response:
                 if response.status == 200:
                     result = await response.json()
-                    logger.info(f"Received offer response from {url}")
+                    logger.info("Received offer response from %s", url)
 
                     if on_answer:
                         await on_answer(url, sender_id, result)
                     else:
                         logger.error(
-                            f"Service response missing answer field from {url}"
+                            "Service response missing answer field from %s", url
                         )
                 else:
                     logger.error(
-                        f"Service returned error from {url}: {response.status} - "
-                        f"{await response.text()}"
+                        "Service returned error from %s: %s - %s",
+                        url,
+                        response.status,
+                        await response.text(),
                     )
         except aiohttp.ClientError as e:
-            logger.error(f"Failed to connect to service at {url}: {e}")
+            logger.error("Failed to connect to service at %s: %s", url, e)
         except Exception as e:
-            logger.error(f"Error relaying WebRTC offer to {url}: {e}")
+            logger.error("Error relaying WebRTC offer to %s: %s", url, e)
 
     async def request_offer_from_ui(
         self,
@@ -270,17 +311,19 @@ class PortalbotService:
             async with self.http_session.get(url) as response:
                 if response.status == 200:
                     result = await response.json()
-                    logger.info(f"Received ui offer response from {url}")
+                    logger.info("Received ui offer response from %s", url)
                     await self.send_to_public_server("offer", {"offer": result})
                 else:
                     logger.error(
-                        f"Service returned error from {url}: {response.status} - "
-                        f"{await response.text()}"
+                        "Service returned error from %s: %s - %s",
+                        url,
+                        response.status,
+                        await response.text(),
                     )
         except aiohttp.ClientError as e:
-            logger.error(f"Failed to connect to service at {url}: {e}")
+            logger.error("Failed to connect to service at %s: %s", url, e)
         except Exception as e:
-            logger.error(f"Error relaying WebRTC offer to {url}: {e}")
+            logger.error("Error relaying WebRTC offer to %s: %s", url, e)
 
     async def handle_webrtc_ice_candidate(self, data: dict):
         """
@@ -296,7 +339,7 @@ class PortalbotService:
             logger.warning("Received ICE candidate without candidate data")
             return
 
-        logger.debug(f"Received ICE candidate from {sender_id}: {candidate}")
+        logger.debug("Received ICE candidate from %s: %s", sender_id, candidate)
 
         if not self.http_session:
             logger.error(
@@ -313,24 +356,39 @@ class PortalbotService:
             "client_id": client_id,
         }
 
-        for url in [vision_url, ui_url]:
-            try:
-                logger.debug(f"Relaying ICE candidate from {sender_id} to {url}")
-                async with self.http_session.post(url, json=payload) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.debug(
-                            f"Received ICE candidate response from {url}: {result}"
-                        )
-                    else:
-                        logger.error(
-                            f"Service error from {url}: {response.status} - "
-                            f"{await response.text()}"
-                        )
-            except aiohttp.ClientError as e:
-                logger.error(f"ClientError while relaying ICE candidate to {url}: {e}")
-            except Exception as e:
-                logger.error(f"Error relaying WebRTC ice candidate to {url}: {e}")
+        # The two services are independent; relay to both at once
+        await asyncio.gather(
+            self.relay_ice_candidate(self.http_session, vision_url, sender_id, payload),
+            self.relay_ice_candidate(self.http_session, ui_url, sender_id, payload),
+        )
+
+    async def relay_ice_candidate(
+        self, session: aiohttp.ClientSession, url: str, sender_id, payload: dict
+    ):
+        """POST an ICE candidate to a local service"""
+        try:
+            logger.debug("Relaying ICE candidate from %s to %s", sender_id, url)
+            async with session.post(url, json=payload) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    logger.debug(
+                        "Received ICE candidate response from %s: %s", url, result
+                    )
+                else:
+                    logger.error(
+                        "Service error from %s: %s - %s",
+                        url,
+                        response.status,
+                        await response.text(),
+                    )
+        except aiohttp.ClientError as e:
+            logger.error(
+                "ClientError while relaying ICE candidate to %s: %s",
+                url,
+                e,
+            )
+        except Exception as e:
+            logger.error("Error relaying WebRTC ice candidate to %s: %s", url, e)
 
     async def handle_participants(self, data: dict):
         """
@@ -340,13 +398,13 @@ class PortalbotService:
         """
         viewer_count = data.get("participants")
         if viewer_count is not None:
-            logger.info(f"Received participants update: {viewer_count} viewers")
+            logger.info("Received participants update: %s viewers", viewer_count)
             await self.send_user_counts_to_hub(int(viewer_count))
 
     async def handle_websocket_message(self, message_type: str, data: dict):
         """Handle messages from the public server"""
         if message_type == "joined_space":
-            logger.info(f"Successfully joined space: {data.get('space')}")
+            logger.info("Successfully joined space: %s", data.get("space"))
 
             await self.handle_participants(data)
 
@@ -380,8 +438,20 @@ class PortalbotService:
             # WebRTC ICE candidate from remote operator
             await self.handle_webrtc_ice_candidate(data)
 
+        elif message_type == "ice_candidate_batch":
+            # Burst of ICE candidates coalesced by the public server.  ICE
+            # doesn't care about candidate order, so relay them concurrently.
+            await asyncio.gather(
+                *(
+                    self.handle_webrtc_ice_candidate(
+                        {"candidate": candidate, "sid": data.get("sid")}
+                    )
+                    for candidate in data.get("candidates", [])
+                )
+            )
+
         elif message_type == "error":
-            logger.error(f"Error from public server: {data.get('message')}")
+            logger.error("Error from public server: %s", data.get("message"))
 
     def on_hub_connect(self, websocket: WebSocketClientProtocol):
         """Called when connected to central hub"""
@@ -391,10 +461,9 @@ class PortalbotService:
         self, websocket: WebSocketClientProtocol, msg_type: str, msg_data: dict
     ):
         """Called when hub state is updated"""
-        # Check for vision frames
         if "servo_config" in msg_data:
             servo_config = msg_data["servo_config"]
-            logger.debug(f"Received servo config update from hub: {servo_config}")
+            logger.debug("Received servo config update from hub: %s", servo_config)
             asyncio.create_task(
                 self.send_to_public_server(
                     "servo_config", {"servo_config": servo_config}
@@ -403,27 +472,42 @@ class PortalbotService:
 
     async def async_main(self):
         """Main async loop"""
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stop_event.set)
+
         # Create HTTP session for vision service communication
         self.http_session = aiohttp.ClientSession()
+        connect_task: Optional[asyncio.Task] = None
 
         try:
             # Start hub monitor (connect to central_hub and subscribe to state updates)
             self.hub_monitor = HubStateMonitor(
                 self.hub_state,
                 "portalbot",
-                "*",  # Subscribe to all state updates
+                ["servo_config"],  # Only subscribe to state this service relays
                 on_connect=self.on_hub_connect,
                 on_state_update=self.on_hub_state_update,
             )
             self.hub_monitor.start()
 
-            # Connect to **public_server** on separate websocket
-            await self.ws_client.connect()
+            # Connect to **public_server** on separate websocket; connect()
+            # reconnects until stopped so it runs alongside the shutdown wait.
+            connect_task = asyncio.create_task(self.ws_client.connect())
 
-            while self.running:
-                await asyncio.sleep(0.1)
+            await self._stop_event.wait()
+            logger.info("Shutting down...")
 
         finally:
+            self.running = False
+            if self.hub_monitor:
+                self.hub_monitor.stop()
+            self.ws_client.stop()
+            if connect_task:
+                connect_task.cancel()
+                await asyncio.gather(connect_task, return_exceptions=True)
+
             # Clean up HTTP session
             if self.http_session:
                 await self.http_session.close()
@@ -432,22 +516,10 @@ class PortalbotService:
         """Main entry point"""
         self.running = True
 
-        # Start async loop in a separate thread
-        async_thread = threading.Thread(target=lambda: asyncio.run(self.async_main()))
-        async_thread.daemon = True
-        async_thread.start()
-
         try:
-            while self.running:
-                # Main thread can be used for other tasks if needed
-                async_thread.join(1)
-        except KeyboardInterrupt:
-            logger.info("Shutting down...")
+            asyncio.run(self.async_main())
         finally:
             self.running = False
-            if self.hub_monitor:
-                self.hub_monitor.stop()
-            self.ws_client.stop()
             logger.info("Shutdown complete")
 
 
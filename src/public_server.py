@@ -11,9 +11,11 @@ accessible.
 
 import os
 import sys
-import json
 import uuid
 from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+import orjson
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
@@ -27,6 +29,9 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+# Load .env before the project imports configure logging (LOG_LEVEL)
+load_dotenv()
+
 from src.commons.space_config import (
     load_spaces_config,
     SpacesConfiguration,
@@ -35,7 +40,7 @@ from src.commons.robot_secrets import (
     init_robot_secrets,
     RobotSecrets,
 )
-from src.server.connection_manager import ConnectionManager
+from src.server.connection_manager import ConnectionManager, encode_message
 from src.server.space_manager import SpaceManager
 from src.server.robot_control_handler import RobotControlHandler
 from src.server.webrtc_signaling import WebRTCSignaling
@@ -43,8 +48,6 @@ from src.commons.logger_utils import get_logger
 
 logger = get_logger("public_server")
 
-load_dotenv()
-
 # Load space configuration
 try:
     spaces_config: SpacesConfiguration = load_spaces_config()
@@ -98,13 +101,32 @@ robot_control_handler = RobotControlHandler(
 )
 webrtc_signaling = WebRTCSignaling(connection_manager, space_manager)
 
+# Constant messages are encoded once at startup rather than per send
+PONG_PAYLOAD = encode_message("pong", {})
+INVALID_JSON_PAYLOAD = encode_message("error", {"message": "Invalid JSON"})
+MALFORMED_MESSAGE_PAYLOAD = encode_message("error", {"message": "Malformed message"})
+SPACE_ID_REQUIRED_PAYLOAD = encode_message("error", {"message": "Space ID is required"})
+SERVO_CONFIG_REQUIRED_PAYLOAD = encode_message(
+    "error", {"message": "Servo config data is required"}
+)
+UNAUTHORIZED_PAYLOAD = encode_message("error", {"message": "Unauthorized"})
+
+
+# Vite emits content-hashed filenames under assets/, so browsers can keep
+# them without revalidating.
+IMMUTABLE_ASSET_PREFIX = "assets/"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 
 class SPAStaticFiles(StaticFiles):
     """Serve index.html for client-side routes while preserving static asset 404s."""
 
     async def get_response(self, path: str, scope):
         try:
-            return await super().get_response(path, scope)
+            response = await super().get_response(path, scope)
+            if path.startswith(IMMUTABLE_ASSET_PREFIX) and response.status_code == 200:
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            return response
         except StarletteHTTPException as exc:
             if exc.status_code != 404:
                 raise
@@ -127,6 +149,9 @@ async def health_check():
         "active_spaces": space_stats["active_spaces"],
         "total_participants": space_stats["total_participants"],
         "connected_clients": conn_stats["total_connections"],
+        "queued_messages": conn_stats["queued_messages"],
+        "dropped_messages": conn_stats["dropped_messages"],
+        "send_timeouts": conn_stats["send_timeouts"],
     }
 
 
@@ -155,7 +180,7 @@ async def get_space(space_id: str):
 
 async def handle_ping(websocket: WebSocket, client_id: str, data: dict):
     """Respond to ping with pong to keep connection alive"""
-    await connection_manager.send_message(websocket, "pong", {})
+    await connection_manager.send_payload(websocket, PONG_PAYLOAD)
 
 
 async def handle_join_space(websocket: WebSocket, client_id: str, data: dict):
@@ -163,9 +188,7 @@ async def handle_join_space(websocket: WebSocket, client_id: str, data: dict):
     space_id = data.get("space")
 
     if not space_id:
-        await connection_manager.send_message(
-            websocket, "error", {"message": "Space ID is required"}
-        )
+        await connection_manager.send_payload(websocket, SPACE_ID_REQUIRED_PAYLOAD)
         return
 
     await space_manager.join_space(websocket, client_id, space_id)
@@ -180,17 +203,13 @@ async def handle_servo_config(websocket: WebSocket, client_id: str, data: dict):
     """Validate that the servo config data is only sent by the robot"""
     servo_config = data.get("servo_config")
     if not servo_config:
-        await connection_manager.send_message(
-            websocket, "error", {"message": "Servo config data is required"}
-        )
+        await connection_manager.send_payload(websocket, SERVO_CONFIG_REQUIRED_PAYLOAD)
         return
 
-    logger.debug(f"Received servo config update from {client_id}: {servo_config}")
+    logger.debug("Received servo config update from %s: %s", client_id, servo_config)
 
     if not space_manager.update_servo_config(client_id, servo_config):
-        await connection_manager.send_message(
-            websocket, "error", {"message": "Unauthorized"}
-        )
+        await connection_manager.send_payload(websocket, UNAUTHORIZED_PAYLOAD)
         return
 
     await space_manager.broadcast_to_space(
@@ -201,9 +220,37 @@ async def handle_servo_config(websocket: WebSocket, client_id: str, data: dict):
     )
 
 
+# Message type -> handler.  Built once rather than per inbound message.
+MESSAGE_HANDLERS: Dict[str, Callable[[WebSocket, str, dict], Awaitable[Any]]] = {
+    "join_space": handle_join_space,
+    "leave_space": handle_leave_space,
+    "offer": webrtc_signaling.handle_offer,
+    "answer": webrtc_signaling.handle_answer,
+    "control_offer": webrtc_signaling.handle_control_offer,
+    "control_answer": webrtc_signaling.handle_control_answer,
+    "ice_candidate": webrtc_signaling.handle_ice_candidate,
+    "ping": handle_ping,
+    "robot_identify": robot_control_handler.handle_robot_identify,
+    "control_request": robot_control_handler.handle_control_request,
+    "control_granted": robot_control_handler.handle_control_granted,
+    "control_release": robot_control_handler.handle_control_release,
+    "set_angles": robot_control_handler.handle_set_angles,
+    "servo_config": handle_servo_config,
+}
+
+
 async def handle_message(websocket: WebSocket, client_id: str, message: dict):
     """Route incoming messages to appropriate handlers"""
-    message_type: str = str(message.get("type"))
+    if (
+        not isinstance(message, dict)
+        or not isinstance(message.get("type"), str)
+        or not isinstance(message.get("data", {}), dict)
+    ):
+        logger.warning("Ignoring malformed message from %s", client_id)
+        await connection_manager.send_payload(websocket, MALFORMED_MESSAGE_PAYLOAD)
+        return
+
+    message_type = message["type"]
     if message_type != "ping":
         logger.info(
             "Received wss message from %s with type=%s",
@@ -212,33 +259,19 @@ async def handle_message(websocket: WebSocket, client_id: str, message: dict):
         )
     data = message.get("data", {})
 
-    handlers = {
-        "join_space": handle_join_space,
-        "leave_space": handle_leave_space,
-        "offer": webrtc_signaling.handle_offer,
-        "answer": webrtc_signaling.handle_answer,
-        "control_offer": webrtc_signaling.handle_control_offer,
-        "control_answer": webrtc_signaling.handle_control_answer,
-        "ice_candidate": webrtc_signaling.handle_ice_candidate,
-        "ping": handle_ping,
-        "robot_identify": robot_control_handler.handle_robot_identify,
-        "control_request": robot_control_handler.handle_control_request,
-        "control_granted": robot_control_handler.handle_control_granted,
-        "control_release": robot_control_handler.handle_control_release,
-        "set_angles": robot_control_handler.handle_set_angles,
-        "servo_config": handle_servo_config,
-    }
-
-    handler = handlers.get(message_type)
+    handler = MESSAGE_HANDLERS.get(message_type)
     if handler:
         await handler(websocket, client_id, data)
     else:
-        logger.warning(f"Unknown message type: {message_type}")
+        logger.warning("Unknown message type: %s", message_type)
 
 
 async def handle_disconnect(client_id: str):
     """Clean up when a client disconnects"""
-    logger.info(f"Client disconnected: {client_id}")
+    logger.info("Client disconnected: %s", client_id)
+
+    # Don't forward ICE candidates still buffered for the departed client
+    webrtc_signaling.cancel_ice_candidates(client_id)
 
     # Handle robot-specific disconnect
     await robot_control_handler.handle_robot_disconnect(client_id)
@@ -267,31 +300,34 @@ async def websocket_endpoint(websocket: WebSocket):
     # Send connected message with client ID
     await connection_manager.send_message(websocket, "connected", {"sid": client_id})
 
-    logger.info(f"Client connected: {client_id}")
+    logger.info("Client connected: %s", client_id)
 
     try:
         while True:
-            # Receive message from client
-            message = await websocket.receive_text()
+            # Receive message from client.  Browsers send text frames but
+            # other clients may send binary; orjson parses either directly.
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            message = frame.get("text")
+            if message is None:
+                message = frame.get("bytes") or b""
 
             # Parse JSON message
             try:
-                data = json.loads(message)
+                data = orjson.loads(message)
                 await handle_message(websocket, client_id, data)
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON received from {client_id}")
-                await connection_manager.send_message(
-                    websocket, "error", {"message": "Invalid JSON"}
-                )
+            except orjson.JSONDecodeError:
+                logger.error("Invalid JSON received from %s", client_id)
+                await connection_manager.send_payload(websocket, INVALID_JSON_PAYLOAD)
 
     except WebSocketDisconnect:
-        await handle_disconnect(client_id)
+        pass
     except Exception as e:
-        logger.error(f"Error in WebSocket connection {client_id}: {e}")
-        await handle_disconnect(client_id)
+        logger.error("Error in WebSocket connection %s: %s", client_id, e)
     finally:
-        # Clean up connection tracking
-        connection_manager.remove_connection(websocket)
+        # Single cleanup path for normal disconnects, errors and cancellation
+        await handle_disconnect(client_id)
 
 
 # Mount static files and templates from the vite build directory
@@ -305,16 +341,51 @@ if __name__ == "__main__":
 
     port = int(os.getenv("PORT", 5080))
     debug = os.getenv("DEBUG", "False").lower() == "true"
+    # uvloop (libuv) has much lower per-send overhead than the default selector
+    # loop. It is not available on Windows; set UVICORN_LOOP=asyncio to opt out
+    # elsewhere.
+    loop = os.getenv("UVICORN_LOOP", "asyncio" if sys.platform == "win32" else "uvloop")
+
+    if loop == "io_uring":
+        # Opt-in completion-based I/O for Linux >= 5.11 hosts with uringcore
+        # installed.  uvicorn is told to leave the installed policy alone.
+        import asyncio
+        import platform
+
+        try:
+            kernel = tuple(int(v) for v in platform.release().split(".")[:2])
+            if sys.platform != "linux" or kernel < (5, 11):
+                raise RuntimeError(f"io_uring unsupported on {platform.platform()}")
+            import uringcore  # type: ignore[import-not-found]
+
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            loop = "none"
+        except (ImportError, RuntimeError, ValueError) as e:
+            print(f"io_uring event loop unavailable ({e}), falling back to uvloop")
+            loop = "uvloop"
 
     print(f"Starting WebRTC signaling server on port {port}")
     print(f"Server running in {'DEBUG' if debug else 'PRODUCTION'} mode")
     print(f"WebSocket endpoint: ws://localhost:{port}/ws")
     print(f"API docs available at: http://localhost:{port}/docs")
+    print(f"Event loop: {loop}")
 
     uvicorn.run(
         "public_server:app",
         host="0.0.0.0",
         port=port,
         reload=debug,
+        loop=loop,
+        # uvicorn[standard] installs websockets, whose wheels include the C
+        # frame (un)masking extension; don't silently fall back to wsproto.
+        ws="websockets",
+        # httptools also comes with uvicorn[standard]; it parses the REST
+        # requests and WebSocket handshakes in C instead of h11.
+        http="httptools",
+        # Signaling frames are small and latency sensitive; compressing them
+        # costs more CPU and buffering than it saves in bytes.
+        ws_per_message_deflate=False,
+        # nginx already keeps an access log in production
+        access_log=debug,
         log_level="debug" if debug else "info",
     )
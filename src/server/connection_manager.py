@@ -9,37 +9,165 @@ Handles:
 - Client type differentiation (robot vs human)
 """
 
-from typing import Dict, Set, Optional
+import asyncio
+from typing import Dict, List, Set, Optional
+
+import orjson
 from fastapi import WebSocket
 
+from src.commons.logger_utils import get_logger
+
+logger = get_logger("connection_manager")
+
+# Messages buffered per client before it is treated as a slow consumer and
+# disconnected.
+OUTBOUND_QUEUE_SIZE = 256
+
+# Message types that are dropped, rather than disconnecting the client, when
+# its outbound queue is full.  Trickle ICE tolerates missing candidates.
+DROPPABLE_MESSAGE_TYPES = frozenset({"ice_candidate", "ice_candidate_batch"})
+
+# Upper bound on how much already-queued traffic the writer merges into one
+# "batch" frame.
+MAX_BATCH_BYTES = 64 * 1024
+
+# How long a single frame write may block before the client is treated as
+# stalled and disconnected.
+SEND_TIMEOUT_SECONDS = 3.0
+
+
+def encode_message(message_type: str, data: dict) -> str:
+    """
+    Serialize a signaling message.
+
+    Broadcasts encode once with this and send the same payload to every
+    recipient.  Payloads are sent as text frames since browser clients
+    JSON.parse() the message event data.
+    """
+    return orjson.dumps({"type": message_type, "data": data}).decode()
+
+
+def _coalesce_queued(payload: str, queue: "asyncio.Queue[str]") -> str:
+    """
+    Merge payloads already waiting in a client's queue behind `payload` into
+    a single {"type": "batch", "data": [...]} message.  Payloads are encoded
+    JSON objects, so they are joined as-is without re-serializing.
+    """
+    payloads = [payload]
+    size = len(payload)
+    while size < MAX_BATCH_BYTES and not queue.empty():
+        queued = queue.get_nowait()
+        payloads.append(queued)
+        size += len(queued)
+
+    if len(payloads) == 1:
+        return payload
+    return '{"type":"batch","data":[' + ",".join(payloads) + "]}"
+
 
 class ConnectionManager:
     """Manages WebSocket connections and message routing"""
 
     def __init__(self):
         # Connection tracking
-        self.connected_clients: Dict[WebSocket, str] = {}  # WebSocket -> client_id
-        self.client_websockets: Dict[str, WebSocket] = {}  # client_id -> WebSocket
+        # client_id -> WebSocket.  The reverse mapping lives on the socket
+        # itself as websocket.state.client_id.
+        self.client_websockets: Dict[str, WebSocket] = {}
         self.client_spaces: Dict[str, Optional[str]] = {}  # client_id -> space_name
 
+        # Outbound messages are queued per client and written by a dedicated
+        # task so a slow receiver never stalls the sender or other clients.
+        self.outbound_queues: Dict[str, "asyncio.Queue[str]"] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
+        self.dropped_messages = 0
+        # Closes of slow clients still in flight; the loop only holds tasks
+        # weakly
+        self.close_tasks: Set[asyncio.Task] = set()
+        self.send_timeouts = 0
+
         # Robot tracking
         self.robot_clients: Dict[str, dict] = {}  # client_id -> robot info
         self.human_clients: Set[str] = set()  # Set of human client_ids
+        # controller client_id -> robot client_id, kept in step with each
+        # robot's "controlled_by"
+        self.controller_to_robot: Dict[str, str] = {}
+        # space_name -> robot client_ids in the space, in registration order
+        self.space_robots: Dict[str, List[str]] = {}
 
     def add_connection(self, websocket: WebSocket, client_id: str):
         """Register a new connection"""
-        self.connected_clients[websocket] = client_id
+        websocket.state.client_id = client_id
         self.client_websockets[client_id] = websocket
         self.client_spaces[client_id] = None
 
-    def remove_connection(self, websocket: WebSocket):
-        """Remove a connection from tracking"""
-        if websocket in self.connected_clients:
-            del self.connected_clients[websocket]
+        queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self.outbound_queues[client_id] = queue
+        self.writer_tasks[client_id] = asyncio.create_task(
+            self._write_loop(client_id, websocket, queue)
+        )
+
+    async def _write_loop(
+        self, client_id: str, websocket: WebSocket, queue: "asyncio.Queue[str]"
+    ):
+        """
+        Drain a client's outbound queue onto its WebSocket.  Messages that
+        piled up while the previous send was in flight go out as one frame.
+        """
+        while True:
+            payload = _coalesce_queued(await queue.get(), queue)
+            try:
+                await asyncio.wait_for(
+                    websocket.send_text(payload), SEND_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # A stalled TCP socket would otherwise park this writer
+                # forever; close it like any other slow consumer.
+                logger.warning("Send to %s timed out, closing connection", client_id)
+                self.send_timeouts += 1
+                if self.outbound_queues.get(client_id) is queue:
+                    del self.outbound_queues[client_id]
+                    self.writer_tasks.pop(client_id, None)
+                self._close_slow_client(client_id, websocket)
+                return
+            except Exception as e:
+                # The socket is gone.  Stop queueing for it so later sends and
+                # broadcasts skip it; websocket_endpoint's receive loop sees
+                # the disconnect and runs the full cleanup once.
+                logger.warning("Error sending message to %s: %s", client_id, e)
+                if self.outbound_queues.get(client_id) is queue:
+                    del self.outbound_queues[client_id]
+                    self.writer_tasks.pop(client_id, None)
+                return
+
+    def _disconnect_slow_client(self, client_id: str, websocket: WebSocket):
+        """Close a client whose outbound queue is full"""
+        logger.warning("Outbound queue full for %s, closing slow connection", client_id)
+        writer_task = self.writer_tasks.pop(client_id, None)
+        if writer_task:
+            writer_task.cancel()
+        self.outbound_queues.pop(client_id, None)
+        self._close_slow_client(client_id, websocket)
+
+    def _close_slow_client(self, client_id: str, websocket: WebSocket):
+        """
+        Close a slow client's socket in the background.  The receive loop in
+        websocket_endpoint sees the disconnect and runs the normal cleanup.
+        """
+        task = asyncio.create_task(websocket.close(code=1008))
+        self.close_tasks.add(task)
+        task.add_done_callback(lambda done: self._on_close_done(client_id, done))
+
+    def _on_close_done(self, client_id: str, task: asyncio.Task):
+        """Forget a finished close task and log any error it raised"""
+        self.close_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning(
+                "Error closing slow connection %s: %s", client_id, task.exception()
+            )
 
     def get_client_id(self, websocket: WebSocket) -> Optional[str]:
         """Get client ID for a WebSocket"""
-        return self.connected_clients.get(websocket)
+        return getattr(websocket.state, "client_id", None)
 
     def get_websocket(self, client_id: str) -> Optional[WebSocket]:
         """Get WebSocket for a client ID"""
@@ -49,12 +177,31 @@ class ConnectionManager:
         self, client_id: str, robot_id: str, robot_name: str, space: str
     ):
         """Register a client as a robot"""
+        self._unindex_controller(client_id)
+        self._unindex_robot_space(client_id)
         self.robot_clients[client_id] = {
             "robot_id": robot_id,
             "robot_name": robot_name,
             "space": space,
             "controlled_by": None,
         }
+        self.space_robots.setdefault(space, []).append(client_id)
+
+    def _unindex_robot_space(self, client_id: str):
+        """Drop a robot from the space index"""
+        robot_info = self.robot_clients.get(client_id)
+        if not robot_info:
+            return
+        space_robots = self.space_robots.get(robot_info["space"])
+        if space_robots and client_id in space_robots:
+            space_robots.remove(client_id)
+            if not space_robots:
+                del self.space_robots[robot_info["space"]]
+
+    def get_robot_client_for_space(self, space_name: str) -> Optional[str]:
+        """Get the client ID of the (first registered) robot in a space"""
+        space_robots = self.space_robots.get(space_name)
+        return space_robots[0] if space_robots else None
 
     def is_robot(self, client_id: str) -> bool:
         """Check if client is a robot"""
@@ -67,7 +214,17 @@ class ConnectionManager:
     def set_robot_controller(self, robot_id: str, controller_id: Optional[str]):
         """Set or clear the controller for a robot"""
         if robot_id in self.robot_clients:
+            self._unindex_controller(robot_id)
             self.robot_clients[robot_id]["controlled_by"] = controller_id
+            if controller_id is not None:
+                self.controller_to_robot[controller_id] = robot_id
+
+    def _unindex_controller(self, robot_id: str):
+        """Drop the reverse index entry for a robot's current controller"""
+        robot_info = self.robot_clients.get(robot_id)
+        controller_id = robot_info.get("controlled_by") if robot_info else None
+        if controller_id and self.controller_to_robot.get(controller_id) == robot_id:
+            del self.controller_to_robot[controller_id]
 
     def get_robot_controller(self, robot_id: str) -> Optional[str]:
         """Get the current controller of a robot"""
@@ -94,10 +251,35 @@ class ConnectionManager:
 
     async def send_message(self, websocket: WebSocket, message_type: str, data: dict):
         """Send a JSON message to a WebSocket client"""
+        await self.send_payload(
+            websocket,
+            encode_message(message_type, data),
+            droppable=message_type in DROPPABLE_MESSAGE_TYPES,
+        )
+
+    async def send_payload(
+        self, websocket: WebSocket, payload: str, droppable: bool = False
+    ):
+        """
+        Send an already encoded message (see encode_message) to a WebSocket client.
+
+        The payload is queued for the client's writer task and this returns
+        without waiting on the socket.  Messages for clients that have already
+        been cleaned up are dropped.  If the client's queue is full, a
+        droppable message is discarded and anything else disconnects the
+        client.
+        """
+        client_id = self.get_client_id(websocket)
+        if client_id is None or client_id not in self.outbound_queues:
+            return
+
         try:
-            await websocket.send_json({"type": message_type, "data": data})
-        except Exception as e:
-            print(f"Error sending message: {e}")
+            self.outbound_queues[client_id].put_nowait(payload)
+        except asyncio.QueueFull:
+            if droppable:
+                self.dropped_messages += 1
+            else:
+                self._disconnect_slow_client(client_id, websocket)
 
     async def send_to_client(self, client_id: str, message_type: str, data: dict):
         """Send a message to a specific client by ID"""
@@ -105,32 +287,46 @@ class ConnectionManager:
         if websocket:
             await self.send_message(websocket, message_type, data)
 
+    async def send_payload_to_client(self, client_id: str, payload: str):
+        """Send an already encoded message to a specific client by ID"""
+        websocket = self.get_websocket(client_id)
+        if websocket:
+            await self.send_payload(websocket, payload)
+
     async def cleanup_client(self, client_id: str):
         """Clean up all tracking for a client"""
         # Remove from robot tracking
         if client_id in self.robot_clients:
+            self._unindex_controller(client_id)
+            self._unindex_robot_space(client_id)
             del self.robot_clients[client_id]
 
         # Remove from human tracking
         self.human_clients.discard(client_id)
 
         # Remove from client tracking
-        if client_id in self.client_spaces:
-            del self.client_spaces[client_id]
-        if client_id in self.client_websockets:
-            del self.client_websockets[client_id]
+        self.client_spaces.pop(client_id, None)
+        self.client_websockets.pop(client_id, None)
+
+        # Stop the writer; anything still queued has nowhere to go
+        self.outbound_queues.pop(client_id, None)
+        writer_task = self.writer_tasks.pop(client_id, None)
+        if writer_task:
+            writer_task.cancel()
 
     def get_connection_stats(self) -> dict:
         """Get connection statistics"""
         return {
-            "total_connections": len(self.connected_clients),
+            "total_connections": len(self.client_websockets),
             "robot_count": len(self.robot_clients),
             "human_count": len(self.human_clients),
+            "queued_messages": sum(
+                queue.qsize() for queue in self.outbound_queues.values()
+            ),
+            "dropped_messages": self.dropped_messages,
+            "send_timeouts": self.send_timeouts,
         }
 
     def find_robot_by_controller(self, controller_id: str) -> Optional[str]:
         """Find which robot a human is controlling"""
-        for robot_id, robot_info in self.robot_clients.items():
-            if robot_info["controlled_by"] == controller_id:
-                return robot_id
-        return None
+        return self.controller_to_robot.get(controller_id)
@@ -13,6 +13,7 @@ from fastapi import WebSocket
 from collections import deque
 from typing import Deque, Dict, Optional
 from src.commons.logger_utils import get_logger
+from src.server.connection_manager import encode_message
 
 logger = get_logger("robot_control_handler")
 
@@ -37,32 +38,35 @@ class RobotControlHandler:
         self.connection_manager = connection_manager
         self.space_manager = space_manager
         self.control_queues: Dict[str, Deque[str]] = {}
+        # queued controller_id -> space_id of the queue it is waiting in
+        self.queued_controller_spaces: Dict[str, str] = {}
 
     def _get_queue(self, space_id: str) -> Deque[str]:
         """Get or create FIFO queue for a space."""
-        if space_id not in self.control_queues:
-            self.control_queues[space_id] = deque()
-        return self.control_queues[space_id]
+        queue = self.control_queues.get(space_id)
+        if queue is None:
+            queue = self.control_queues[space_id] = deque()
+        return queue
+
+    def _enqueue_controller(self, space_id: str, controller_id: str) -> Deque[str]:
+        """Append a controller to a space's queue."""
+        queue = self._get_queue(space_id)
+        queue.append(controller_id)
+        self.queued_controller_spaces[controller_id] = space_id
+        return queue
 
     def _remove_queued_controller(self, controller_id: str) -> Optional[str]:
         """Remove a controller from whichever queue it is in."""
-        for space_id, queue in list(self.control_queues.items()):
-            if controller_id in queue:
-                queue.remove(controller_id)
-                if not queue:
-                    del self.control_queues[space_id]
-                return space_id
-        return None
-
-    def _get_robot_client_id_for_space(self, space_id: str) -> Optional[str]:
-        """Find the robot websocket client ID for a space."""
-        for (
-            robot_client_id,
-            robot_info,
-        ) in self.connection_manager.robot_clients.items():
-            if robot_info.get("space") == space_id:
-                return robot_client_id
-        return None
+        space_id = self.queued_controller_spaces.pop(controller_id, None)
+        if space_id is None:
+            return None
+
+        queue = self.control_queues.get(space_id)
+        if queue and controller_id in queue:
+            queue.remove(controller_id)
+            if not queue:
+                del self.control_queues[space_id]
+        return space_id
 
     async def _grant_control(self, robot_id: str, controller_id: str):
         """Grant control and notify the browser client."""
@@ -82,15 +86,9 @@ class RobotControlHandler:
     async def _grant_next_controller(self, robot_id: str, space_id: str):
         """Pop the next connected requester from the queue and grant control."""
         queue = self.control_queues.get(space_id)
-        if queue is None:
-            return
-
-        if len(queue) == 0:
-            self.control_queues.pop(space_id, None)
-            return
-
         while queue:
             next_controller_id = queue.popleft()
+            self.queued_controller_spaces.pop(next_controller_id, None)
             if self.connection_manager.get_websocket(next_controller_id):
                 await self._grant_control(robot_id, next_controller_id)
                 break
@@ -136,8 +134,9 @@ class RobotControlHandler:
                     "message": f"Robot '{robot_id}' is not authorized to access space '{space_id}'"
                 },
             )
-            print(
-                f"Robot authentication failed for {robot_id}: not in space's allowed list"
+            logger.warning(
+                "Robot authentication failed for %s: not in space's allowed list",
+                robot_id,
             )
             return
 
@@ -146,7 +145,9 @@ class RobotControlHandler:
             await self.connection_manager.send_message(
                 websocket, "error", {"message": "Invalid robot credentials"}
             )
-            print(f"Robot authentication failed for {robot_id}: invalid secret key")
+            logger.warning(
+                "Robot authentication failed for %s: invalid secret key", robot_id
+            )
             return
 
         # Register as robot
@@ -159,8 +160,11 @@ class RobotControlHandler:
         if not success:
             return
 
-        print(
-            f"Robot '{robot_name}' (ID: {robot_id}) authenticated and joined space: {space_id}"
+        logger.info(
+            "Robot '%s' (ID: %s) authenticated and joined space: %s",
+            robot_name,
+            robot_id,
+            space_id,
         )
 
         # Send success response
@@ -201,15 +205,15 @@ class RobotControlHandler:
             )
             return
 
-        robot_id = self._get_robot_client_id_for_space(space_id)
+        robot_id = self.connection_manager.get_robot_client_for_space(space_id)
         if not robot_id:
             queue = self._get_queue(space_id)
             if client_id not in queue:
-                queue.append(client_id)
+                self._enqueue_controller(space_id, client_id)
             await self.connection_manager.send_message(
                 websocket,
                 "control_pending",
-                {"position": list(queue).index(client_id) + 1},
+                {"position": queue.index(client_id) + 1},
             )
             return
 
@@ -225,19 +229,18 @@ class RobotControlHandler:
             await self.connection_manager.send_message(
                 websocket,
                 "control_pending",
-                {"position": list(pending_queue).index(client_id) + 1},
+                {"position": pending_queue.index(client_id) + 1},
             )
             return
 
         current_controller_id = self.connection_manager.get_robot_controller(robot_id)
-        print(f"Human {client_id} requesting control of robot {robot_id}")
+        logger.info("Human %s requesting control of robot %s", client_id, robot_id)
 
         if current_controller_id is None and not pending_queue:
             await self._grant_control(robot_id, client_id)
             return
 
-        queue = self._get_queue(space_id)
-        queue.append(client_id)
+        queue = self._enqueue_controller(space_id, client_id)
         await self.connection_manager.send_message(
             websocket, "control_pending", {"position": len(queue)}
         )
@@ -266,12 +269,14 @@ class RobotControlHandler:
         if self.connection_manager.is_robot(client_id):
             # Robot is releasing control
             robot_id = client_id
-            controller_id = self.connection_manager.get_robot_controller(robot_id)
             robot_info = self.connection_manager.get_robot_info(robot_id) or {}
+            controller_id = robot_info.get("controlled_by")
             space_id = robot_info.get("space")
             if controller_id:
                 self.connection_manager.set_robot_controller(robot_id, None)
-                print(f"Robot {robot_id} released control from human {controller_id}")
+                logger.info(
+                    "Robot %s released control from human %s", robot_id, controller_id
+                )
 
                 # Notify human
                 await self.connection_manager.send_to_client(
@@ -289,7 +294,7 @@ class RobotControlHandler:
                 robot_info = self.connection_manager.get_robot_info(robot_id) or {}
                 space_id = robot_info.get("space")
                 self.connection_manager.set_robot_controller(robot_id, None)
-                print(f"Human {human_id} released control of robot {robot_id}")
+                logger.info("Human %s released control of robot %s", human_id, robot_id)
 
                 # Notify robot
                 await self.connection_manager.send_to_client(
@@ -352,7 +357,7 @@ class RobotControlHandler:
         if not robot_info:
             return
 
-        print(f"Robot '{robot_info['robot_name']}' disconnected")
+        logger.info("Robot '%s' disconnected", robot_info["robot_name"])
         space_id = robot_info.get("space")
 
         # Release control if any
@@ -367,10 +372,17 @@ class RobotControlHandler:
 
         queue = self.control_queues.pop(space_id, deque()) if space_id else deque()
         for queued_controller_id in queue:
-            await self.connection_manager.send_to_client(
-                queued_controller_id,
-                "control_released",
-                {"robot_id": client_id, "reason": "Robot disconnected"},
+            self.queued_controller_spaces.pop(queued_controller_id, None)
+        if not queue:
+            return
+
+        # Every queued controller gets the same message; encode it once
+        payload = encode_message(
+            "control_released", {"robot_id": client_id, "reason": "Robot disconnected"}
+        )
+        for queued_controller_id in queue:
+            await self.connection_manager.send_payload_to_client(
+                queued_controller_id, payload
             )
 
     async def handle_human_disconnect(self, client_id: str):
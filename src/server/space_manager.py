@@ -9,13 +9,26 @@ Handles:
 - Broadcasting to space members
 """
 
-from typing import Dict, Set, Optional
+from typing import AbstractSet, Dict, Optional
 from fastapi import WebSocket
 
+from src.commons.logger_utils import get_logger
+from src.server.connection_manager import DROPPABLE_MESSAGE_TYPES, encode_message
+
+logger = get_logger("space_manager")
+
 
 class SpaceManager:
     """Manages spaces and their participants"""
 
+    __slots__ = (
+        "spaces_config",
+        "connection_manager",
+        "enabled_spaces",
+        "active_spaces",
+        "servo_configs",
+    )
+
     def __init__(self, spaces_config, connection_manager):
         """
         Initialize the space manager.
@@ -26,7 +39,13 @@ class SpaceManager:
         """
         self.spaces_config = spaces_config
         self.connection_manager = connection_manager
-        self.active_spaces: Dict[str, Set[str]] = {}  # space_name -> Set[client_id]
+        # Joinable spaces by ID, so join validation is a single dict lookup
+        self.enabled_spaces = {
+            space.id: space for space in spaces_config.get_enabled_spaces()
+        }
+        # space_name -> {client_id: WebSocket}.  Keeping the sockets here lets
+        # broadcasts skip a client_id -> WebSocket lookup per recipient.
+        self.active_spaces: Dict[str, Dict[str, WebSocket]] = {}
         self.servo_configs: Dict[str, dict] = {}  # space_name -> servo_config
 
     async def join_space(
@@ -37,35 +56,28 @@ class SpaceManager:
 
         Returns True if successful, False otherwise.
         """
-        # Validate space exists in configuration
-        space_config = self.spaces_config.get_space_by_id(space_id)
-        if not space_config:
-            await self.connection_manager.send_message(
-                websocket,
-                "error",
-                {
-                    "message": f"Space '{space_id}' does not exist. Please select a valid space."
-                },
-            )
-            return False
-
-        # Check if space is enabled
-        if not space_config.enabled:
+        # Validate space exists in configuration and is enabled
+        space_config = self.enabled_spaces.get(space_id)
+        if space_config is None:
+            disabled_space = self.spaces_config.get_space_by_id(space_id)
+            if disabled_space is None:
+                message = (
+                    f"Space '{space_id}' does not exist. Please select a valid space."
+                )
+            else:
+                message = (
+                    f"Space '{disabled_space.display_name}' is currently unavailable."
+                )
             await self.connection_manager.send_message(
-                websocket,
-                "error",
-                {
-                    "message": f"Space '{space_config.display_name}' is currently unavailable."
-                },
+                websocket, "error", {"message": message}
             )
             return False
 
         # Initialize space if it doesn't exist
-        if space_id not in self.active_spaces:
-            self.active_spaces[space_id] = set()
+        space_clients = self.active_spaces.setdefault(space_id, {})
 
         # Check if space is full using configured max_participants
-        if len(self.active_spaces[space_id]) >= space_config.max_participants:
+        if len(space_clients) >= space_config.max_participants:
             await self.connection_manager.send_message(
                 websocket,
                 "error",
@@ -76,11 +88,15 @@ class SpaceManager:
             return False
 
         # Add client to space
-        self.active_spaces[space_id].add(client_id)
+        space_clients[client_id] = websocket
         self.connection_manager.set_client_space(client_id, space_id)
+        participant_count = len(space_clients)
 
-        print(
-            f"Client {client_id} joined space: {space_id} ({space_config.display_name})"
+        logger.info(
+            "Client %s joined space: %s (%s)",
+            client_id,
+            space_id,
+            space_config.display_name,
         )
 
         # Notify the joining client
@@ -89,7 +105,7 @@ class SpaceManager:
             "joined_space",
             {
                 "space": space_id,
-                "participants": len(self.active_spaces[space_id]),
+                "participants": participant_count,
             },
         )
         await self.send_servo_config_to_client(client_id)
@@ -98,7 +114,7 @@ class SpaceManager:
         await self.broadcast_to_space(
             space_id,
             "user_joined",
-            {"sid": client_id, "participants": len(self.active_spaces[space_id])},
+            {"sid": client_id, "participants": participant_count},
             exclude_client_id=client_id,
         )
 
@@ -112,23 +128,25 @@ class SpaceManager:
             return
 
         # Remove client from space
-        if space_name in self.active_spaces:
-            self.active_spaces[space_name].discard(client_id)
-
-            # Notify other participants
-            await self.broadcast_to_space(
-                space_name,
-                "user_left",
-                {"participants": len(self.active_spaces[space_name])},
-                exclude_client_id=client_id,
-            )
-
-            # Clean up empty spaces
-            if len(self.active_spaces[space_name]) == 0:
+        space_clients = self.active_spaces.get(space_name)
+        if space_clients is not None:
+            space_clients.pop(client_id, None)
+
+            if space_clients:
+                # Notify other participants
+                await self.broadcast_to_space(
+                    space_name,
+                    "user_left",
+                    {"participants": len(space_clients)},
+                    exclude_client_id=client_id,
+                )
+            else:
+                # Clean up empty spaces before awaiting anything, so a client
+                # joining meanwhile can't be dropped with the old dict
                 del self.active_spaces[space_name]
 
         self.connection_manager.set_client_space(client_id, None)
-        print(f"Client {client_id} left space: {space_name}")
+        logger.info("Client %s left space: %s", client_id, space_name)
 
     async def broadcast_to_space(
         self,
@@ -138,18 +156,33 @@ class SpaceManager:
         exclude_client_id: Optional[str] = None,
     ):
         """Broadcast a message to all clients in a space, optionally excluding one"""
-        if space_name not in self.active_spaces:
+        space_clients = self.active_spaces.get(space_name)
+        if not space_clients:
             return
 
-        for client_id in self.active_spaces[space_name]:
-            if client_id != exclude_client_id:
-                await self.connection_manager.send_to_client(
-                    client_id, message_type, data
-                )
+        if exclude_client_id in space_clients:
+            recipients = [
+                websocket
+                for client_id, websocket in space_clients.items()
+                if client_id != exclude_client_id
+            ]
+        else:
+            # Nobody to skip, so no per-member compare
+            recipients = list(space_clients.values())
+        if not recipients:
+            return
+
+        # Serialize once; every recipient gets the same payload.  send_payload
+        # only queues it for each client's writer task, so nothing here waits
+        # on a socket.
+        payload = encode_message(message_type, data)
+        droppable = message_type in DROPPABLE_MESSAGE_TYPES
+        for websocket in recipients:
+            await self.connection_manager.send_payload(websocket, payload, droppable)
 
-    def get_space_participants(self, space_name: str) -> Set[str]:
-        """Get list of participants in a space"""
-        return self.active_spaces.get(space_name, set())
+    def get_space_participants(self, space_name: str) -> AbstractSet[str]:
+        """Get the client IDs of participants in a space"""
+        return self.active_spaces.get(space_name, {}).keys()
 
     def get_stats(self) -> dict:
         """Get space statistics"""
@@ -172,25 +205,31 @@ class SpaceManager:
         """Add or update servo configuration for a space"""
         space_name = self.connection_manager.get_client_space(client_id)
         if not space_name:
-            print(f"Cannot add servo config: client {client_id} is not in a space")
+            logger.warning(
+                "Cannot add servo config: client %s is not in a space", client_id
+            )
             return False
         if not self.is_robot_in_space(space_name, client_id):
-            print(f"Unauthorized servo config update attempt from {client_id}")
+            logger.warning(
+                "Unauthorized servo config update attempt from %s", client_id
+            )
             return False
 
         self.servo_configs[space_name] = servo_config
-        print(f"Updated servo config for space {space_name}: {servo_config}")
+        logger.debug("Updated servo config for space %s: %s", space_name, servo_config)
         return True
 
     async def send_servo_config_to_client(self, client_id: str):
         """Send the current servo config for the client's space"""
         space_name = self.connection_manager.get_client_space(client_id)
         if not space_name:
-            print(f"Cannot send servo config: client {client_id} is not in a space")
+            logger.warning(
+                "Cannot send servo config: client %s is not in a space", client_id
+            )
             return
         servo_config = self.servo_configs.get(space_name)
         if not servo_config:
-            print(f"No servo config found for space {space_name}")
+            logger.debug("No servo config found for space %s", space_name)
             return
 
         await self.connection_manager.send_to_client(
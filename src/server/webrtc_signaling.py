@@ -8,12 +8,17 @@ Handles:
 - Peer signaling within spaces
 """
 
+import asyncio
 from fastapi import WebSocket
-from typing import Optional
+from typing import Dict, List
 from src.commons.logger_utils import get_logger
 
 logger = get_logger("webrtc_signaling")
 
+# How long ICE candidates from one sender are collected before they are
+# forwarded together.  Browsers trickle a burst of candidates within a few ms.
+ICE_BATCH_WINDOW_SECONDS = 0.01
+
 
 class WebRTCSignaling:
     """Handles WebRTC peer signaling"""
@@ -28,16 +33,10 @@ class WebRTCSignaling:
         """
         self.connection_manager = connection_manager
         self.space_manager = space_manager
-
-    def _get_robot_client_in_space(self, space_name: str) -> Optional[str]:
-        """Return the robot client ID for the given space."""
-        for (
-            robot_client_id,
-            robot_info,
-        ) in self.connection_manager.robot_clients.items():
-            if robot_info.get("space") == space_name:
-                return robot_client_id
-        return None
+        # sender client_id -> ICE candidates waiting to be forwarded together
+        self.pending_ice_candidates: Dict[str, List[dict]] = {}
+        # sender client_id -> task that forwards its pending candidates
+        self.ice_flush_tasks: Dict[str, asyncio.Task] = {}
 
     async def handle_offer(self, websocket: WebSocket, client_id: str, data: dict):
         """Forward WebRTC offer to the other peer in the space"""
@@ -48,7 +47,7 @@ class WebRTCSignaling:
             logger.error("Received offer without space name or offer data")
             return
 
-        print(f"Forwarding offer in space: {space_name}")
+        logger.debug("Forwarding offer in space: %s", space_name)
         await self.space_manager.broadcast_to_space(
             space_name,
             "offer",
@@ -67,7 +66,7 @@ class WebRTCSignaling:
             logger.error("Received control offer without space name or offer data")
             return
 
-        robot_client_id = self._get_robot_client_in_space(space_name)
+        robot_client_id = self.connection_manager.get_robot_client_for_space(space_name)
         if not robot_client_id:
             logger.error("No robot connected in space %s for control offer", space_name)
             await self.connection_manager.send_message(
@@ -89,7 +88,7 @@ class WebRTCSignaling:
             )
             return
 
-        print(f"Forwarding control offer in space: {space_name}")
+        logger.debug("Forwarding control offer in space: %s", space_name)
         await self.connection_manager.send_to_client(
             robot_client_id, "control_offer", {"offer": offer, "sid": client_id}
         )
@@ -103,7 +102,7 @@ class WebRTCSignaling:
             logger.error("Received answer without space name or answer data")
             return
 
-        print(f"Forwarding answer in space: {space_name}")
+        logger.debug("Forwarding answer in space: %s", space_name)
         # TODO(#12): Send answer only to the original offer sender once
         # targeted routing is implemented for control/view signaling.
         await self.space_manager.broadcast_to_space(
@@ -122,7 +121,7 @@ class WebRTCSignaling:
         answer = data.get("answer")
 
         logger.info(
-            f"Handling control answer from client {client_id} in space {space_name}"
+            "Handling control answer from client %s in space %s", client_id, space_name
         )
 
         if not space_name or not answer:
@@ -145,7 +144,7 @@ class WebRTCSignaling:
             )
             return
 
-        print(f"Forwarding answer in space: {space_name}")
+        logger.debug("Forwarding control answer in space: %s", space_name)
         await self.connection_manager.send_to_client(
             controller_id, "control_answer", {"answer": answer, "sid": client_id}
         )
@@ -153,17 +152,70 @@ class WebRTCSignaling:
     async def handle_ice_candidate(
         self, websocket: WebSocket, client_id: str, data: dict
     ):
-        """Forward ICE candidate to the other peer in the space"""
+        """
+        Forward ICE candidate to the other peers in the space.
+
+        Trickle ICE produces bursts of candidates.  Candidates from the same
+        sender that arrive within ICE_BATCH_WINDOW_SECONDS of the first go out
+        together as one ice_candidate_batch message; a lone candidate is still
+        sent as ice_candidate.
+        """
         space_name = self.connection_manager.get_client_space(client_id)
         candidate = data.get("candidate")
 
         if not space_name or not candidate:
             return
 
-        print(f"Forwarding ICE candidate in space: {space_name}")
-        await self.space_manager.broadcast_to_space(
-            space_name,
-            "ice_candidate",
-            {"candidate": candidate, "sid": client_id},
-            exclude_client_id=client_id,
+        pending = self.pending_ice_candidates.get(client_id)
+        if pending is not None:
+            pending.append(candidate)
+            return
+
+        self.pending_ice_candidates[client_id] = [candidate]
+        task = asyncio.create_task(self._flush_ice_candidates(client_id))
+        self.ice_flush_tasks[client_id] = task
+        task.add_done_callback(lambda done: self._on_ice_flush_done(client_id, done))
+
+    def _on_ice_flush_done(self, client_id: str, task: asyncio.Task):
+        """Forget a finished flush task and surface any error it raised"""
+        if self.ice_flush_tasks.get(client_id) is task:
+            del self.ice_flush_tasks[client_id]
+        if not task.cancelled() and task.exception():
+            logger.error(
+                "Error forwarding ICE candidates from %s: %s",
+                client_id,
+                task.exception(),
+            )
+
+    def cancel_ice_candidates(self, client_id: str):
+        """Drop a disconnecting client's buffered ICE candidates"""
+        self.pending_ice_candidates.pop(client_id, None)
+        task = self.ice_flush_tasks.pop(client_id, None)
+        if task:
+            task.cancel()
+
+    async def _flush_ice_candidates(self, client_id: str):
+        """Forward all ICE candidates buffered for a sender"""
+        await asyncio.sleep(ICE_BATCH_WINDOW_SECONDS)
+        candidates = self.pending_ice_candidates.pop(client_id, [])
+        space_name = self.connection_manager.get_client_space(client_id)
+        if not space_name or not candidates:
+            return
+
+        logger.debug(
+            "Forwarding %d ICE candidate(s) in space: %s", len(candidates), space_name
         )
+        if len(candidates) == 1:
+            await self.space_manager.broadcast_to_space(
+                space_name,
+                "ice_candidate",
+                {"candidate": candidates[0], "sid": client_id},
+                exclude_client_id=client_id,
+            )
+        else:
+            await self.space_manager.broadcast_to_space(
+                space_name,
+                "ice_candidate_batch",
+                {"candidates": candidates, "sid": client_id},
+                exclude_client_id=client_id,
+            )
@@ -0,0 +1,209 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.server import connection_manager as connection_manager_module
+from src.server.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.state = SimpleNamespace()
+        self.sent = []
+        self.closed_with = None
+        self.unblock = asyncio.Event()
+        self.block_sends = False
+
+    async def send_text(self, payload):
+        if self.block_sends:
+            await self.unblock.wait()
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def test_messages_are_written_in_order():
+    async def scenario():
+        connection_manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        connection_manager.add_connection(websocket, "client-1")
+
+        await connection_manager.send_message(websocket, "first", {})
+        await asyncio.sleep(0)
+        await connection_manager.send_to_client("client-1", "second", {"n": 2})
+        await asyncio.sleep(0.01)
+
+        await connection_manager.cleanup_client("client-1")
+        return websocket
+
+    websocket = asyncio.run(scenario())
+
+    assert websocket.sent == [
+        {"type": "first", "data": {}},
+        {"type": "second", "data": {"n": 2}},
+    ]
+
+
+def test_queued_messages_are_sent_as_one_batch():
+    async def scenario():
+        connection_manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        connection_manager.add_connection(websocket, "client-1")
+
+        # Both are queued before the writer task first runs
+        await connection_manager.send_message(websocket, "first", {})
+        await connection_manager.send_to_client("client-1", "second", {"n": 2})
+        await asyncio.sleep(0)
+
+        await connection_manager.cleanup_client("client-1")
+        return websocket
+
+    websocket = asyncio.run(scenario())
+
+    assert websocket.sent == [
+        {
+            "type": "batch",
+            "data": [
+                {"type": "first", "data": {}},
+                {"type": "second", "data": {"n": 2}},
+            ],
+        }
+    ]
+
+
+def test_slow_client_does_not_block_sender_and_is_closed(monkeypatch):
+    monkeypatch.setattr(connection_manager_module, "OUTBOUND_QUEUE_SIZE", 2)
+
+    async def scenario():
+        connection_manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        websocket.block_sends = True
+        connection_manager.add_connection(websocket, "slow-client")
+
+        # The writer takes one message and blocks on it; two more fill the
+        # queue and the next overflows it.
+        for n in range(4):
+            await connection_manager.send_message(websocket, "update", {"n": n})
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert "slow-client" not in connection_manager.outbound_queues
+        await connection_manager.cleanup_client("slow-client")
+        assert connection_manager.close_tasks == set()
+        return websocket
+
+    websocket = asyncio.run(scenario())
+
+    assert websocket.closed_with == 1008
+    assert websocket.sent == []
+
+
+def test_find_robot_by_controller_tracks_controller_changes():
+    connection_manager = ConnectionManager()
+    connection_manager.register_robot("robot-client", "robot-1", "Robot", "space-a")
+
+    connection_manager.set_robot_controller("robot-client", "human-1")
+    assert connection_manager.find_robot_by_controller("human-1") == "robot-client"
+
+    connection_manager.set_robot_controller("robot-client", "human-2")
+    assert connection_manager.find_robot_by_controller("human-1") is None
+    assert connection_manager.find_robot_by_controller("human-2") == "robot-client"
+
+    connection_manager.set_robot_controller("robot-client", None)
+    assert connection_manager.find_robot_by_controller("human-2") is None
+
+
+def test_cleanup_robot_clears_controller_index():
+    connection_manager = ConnectionManager()
+    connection_manager.register_robot("robot-client", "robot-1", "Robot", "space-a")
+    connection_manager.set_robot_controller("robot-client", "human-1")
+
+    asyncio.run(connection_manager.cleanup_client("robot-client"))
+
+    assert connection_manager.find_robot_by_controller("human-1") is None
+
+
+def test_robot_client_for_space_follows_registration_and_cleanup():
+    connection_manager = ConnectionManager()
+    connection_manager.register_robot("robot-a", "robot-1", "Robot", "space-a")
+    connection_manager.register_robot("robot-b", "robot-2", "Robot", "space-b")
+
+    assert connection_manager.get_robot_client_for_space("space-a") == "robot-a"
+    assert connection_manager.get_robot_client_for_space("space-b") == "robot-b"
+
+    asyncio.run(connection_manager.cleanup_client("robot-a"))
+
+    assert connection_manager.get_robot_client_for_space("space-a") is None
+    assert connection_manager.space_robots == {"space-b": ["robot-b"]}
+
+
+def test_failed_send_stops_queueing_for_client():
+    class BrokenWebSocket(FakeWebSocket):
+        async def send_text(self, payload):
+            raise RuntimeError("socket closed")
+
+    async def scenario():
+        connection_manager = ConnectionManager()
+        websocket = BrokenWebSocket()
+        connection_manager.add_connection(websocket, "client-1")
+
+        await connection_manager.send_message(websocket, "first", {})
+        await asyncio.sleep(0)
+        await connection_manager.send_message(websocket, "second", {})
+        return connection_manager
+
+    connection_manager = asyncio.run(scenario())
+
+    assert "client-1" not in connection_manager.outbound_queues
+    assert "client-1" not in connection_manager.writer_tasks
+
+
+def test_full_queue_drops_ice_candidates_without_closing(monkeypatch):
+    monkeypatch.setattr(connection_manager_module, "OUTBOUND_QUEUE_SIZE", 2)
+
+    async def scenario():
+        connection_manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        websocket.block_sends = True
+        connection_manager.add_connection(websocket, "slow-client")
+
+        for n in range(4):
+            await connection_manager.send_message(
+                websocket, "ice_candidate", {"candidate": n}
+            )
+            await asyncio.sleep(0)
+
+        stats = connection_manager.get_connection_stats()
+        await connection_manager.cleanup_client("slow-client")
+        return websocket, stats
+
+    websocket, stats = asyncio.run(scenario())
+
+    assert websocket.closed_with is None
+    assert stats["dropped_messages"] == 1
+    assert stats["queued_messages"] == 2
+
+
+def test_stalled_send_times_out_and_closes_client(monkeypatch):
+    monkeypatch.setattr(connection_manager_module, "SEND_TIMEOUT_SECONDS", 0.01)
+
+    async def scenario():
+        connection_manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        websocket.block_sends = True
+        connection_manager.add_connection(websocket, "stalled-client")
+
+        await connection_manager.send_message(websocket, "update", {})
+        await asyncio.sleep(0.05)
+
+        assert "stalled-client" not in connection_manager.outbound_queues
+        stats = connection_manager.get_connection_stats()
+        await connection_manager.cleanup_client("stalled-client")
+        assert connection_manager.close_tasks == set()
+        return websocket, stats
+
+    websocket, stats = asyncio.run(scenario())
+
+    assert websocket.closed_with == 1008
+    assert stats["send_timeouts"] == 1
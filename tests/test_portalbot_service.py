@@ -0,0 +1,60 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+# portalbot_service needs the robot-side dependencies
+pytest.importorskip("aiohttp")
+pytest.importorskip("basic_bot")
+
+from src import portalbot_service as portalbot_service_module  # noqa: E402
+from src.portalbot_service import PortalbotService  # noqa: E402
+
+
+def build_service(monkeypatch, send_seconds=0.0):
+    sent = []
+
+    async def send_update_state(_websocket, update):
+        await asyncio.sleep(send_seconds)
+        sent.append(update)
+
+    monkeypatch.setattr(
+        portalbot_service_module.messages, "send_update_state", send_update_state
+    )
+
+    # Skip __init__, which loads the robot config and secret key
+    service = PortalbotService.__new__(PortalbotService)
+    service._pending_hub_update = {}
+    service._hub_flush_task = None
+    service.hub_monitor = SimpleNamespace(connected_socket=object())
+    return service, sent
+
+
+def test_relayed_commands_are_coalesced(monkeypatch):
+    service, sent = build_service(monkeypatch)
+
+    async def scenario():
+        await service.relay_command_to_hub({"servo_angles": {"pan": 1}})
+        await service.relay_command_to_hub({"servo_angles": {"tilt": 2}})
+        await service.relay_command_to_hub({"servo_angles": {"pan": 3}})
+        await service._hub_flush_task
+
+    asyncio.run(scenario())
+
+    assert sent == [{"servo_angles": {"pan": 3, "tilt": 2}}]
+
+
+def test_command_arriving_during_flush_is_sent(monkeypatch):
+    service, sent = build_service(monkeypatch, send_seconds=0.05)
+
+    async def scenario():
+        await service.relay_command_to_hub({"servo_angles": {"pan": 1}})
+        # Let the first flush get into its (slow) send
+        await asyncio.sleep(portalbot_service_module.HUB_RELAY_COALESCE_SECONDS * 2)
+        await service.relay_command_to_hub({"servo_angles": {"pan": 2}})
+        await service._hub_flush_task
+
+    asyncio.run(scenario())
+
+    assert sent == [{"servo_angles": {"pan": 1}}, {"servo_angles": {"pan": 2}}]
+    assert service._pending_hub_update == {}
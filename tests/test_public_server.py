@@ -0,0 +1,74 @@
+import asyncio
+import importlib
+
+import orjson
+import pytest
+
+# public_server loads .env at import time
+pytest.importorskip("dotenv")
+
+
+@pytest.fixture
+def public_server(tmp_path, monkeypatch):
+    # The app mounts the webapp build relative to the working directory
+    (tmp_path / "webapp" / "dist").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("src.public_server")
+
+
+class FakeConnectionManager:
+    def __init__(self):
+        self.sent = []
+
+    async def send_payload(self, websocket, payload, droppable=False):
+        self.sent.append((websocket, orjson.loads(payload)))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        ["join_space"],
+        {"data": {}},
+        {"type": 42, "data": {}},
+        {"type": "join_space", "data": "x"},
+        {"type": "ice_candidate", "data": [{"candidate": "a"}]},
+    ],
+)
+def test_malformed_message_gets_error_reply(public_server, monkeypatch, message):
+    connection_manager = FakeConnectionManager()
+    monkeypatch.setattr(public_server, "connection_manager", connection_manager)
+    handled = []
+
+    async def handler(websocket, client_id, data):
+        handled.append(data)
+
+    monkeypatch.setitem(public_server.MESSAGE_HANDLERS, "join_space", handler)
+    monkeypatch.setitem(public_server.MESSAGE_HANDLERS, "ice_candidate", handler)
+    websocket = object()
+
+    asyncio.run(public_server.handle_message(websocket, "human-1", message))
+
+    assert handled == []
+    assert connection_manager.sent == [
+        (websocket, {"type": "error", "data": {"message": "Malformed message"}})
+    ]
+
+
+def test_well_formed_message_is_routed(public_server, monkeypatch):
+    connection_manager = FakeConnectionManager()
+    monkeypatch.setattr(public_server, "connection_manager", connection_manager)
+    handled = []
+
+    async def handler(websocket, client_id, data):
+        handled.append((client_id, data))
+
+    monkeypatch.setitem(public_server.MESSAGE_HANDLERS, "join_space", handler)
+
+    asyncio.run(
+        public_server.handle_message(
+            object(), "human-1", {"type": "join_space", "data": {"space": "a"}}
+        )
+    )
+
+    assert handled == [("human-1", {"space": "a"})]
+    assert connection_manager.sent == []
@@ -1,4 +1,5 @@
 import asyncio
+import json
 
 from src.server.robot_control_handler import RobotControlHandler
 
@@ -15,6 +16,12 @@ class FakeConnectionManager:
     def is_robot(self, client_id):
         return client_id in self.robot_clients
 
+    def get_robot_client_for_space(self, space_name):
+        for robot_id, robot_info in self.robot_clients.items():
+            if robot_info.get("space") == space_name:
+                return robot_id
+        return None
+
     def get_robot_info(self, client_id):
         return self.robot_clients.get(client_id)
 
@@ -51,6 +58,10 @@ class FakeConnectionManager:
     async def send_to_client(self, client_id, message_type, data):
         self.sent_to_client.append((client_id, message_type, data))
 
+    async def send_payload_to_client(self, client_id, payload):
+        message = json.loads(payload)
+        self.sent_to_client.append((client_id, message["type"], message["data"]))
+
 
 class FakeSpaceManager:
     pass
@@ -170,3 +181,35 @@ def test_robot_disconnect_clears_stale_controller_mapping():
     asyncio.run(handler.handle_robot_disconnect(robot_client_id))
 
     assert connection_manager.get_robot_controller(robot_client_id) is None
+
+
+def test_queued_controller_index_follows_queue():
+    handler, connection_manager, robot_client_id = build_handler()
+
+    for human_id in ["human-1", "human-2", "human-3"]:
+        asyncio.run(handler.handle_control_request(object(), human_id, {}))
+    assert handler.queued_controller_spaces == {
+        "human-2": "space-a",
+        "human-3": "space-a",
+    }
+
+    asyncio.run(handler.handle_control_release(object(), "human-1", {}))
+    assert handler.queued_controller_spaces == {"human-3": "space-a"}
+
+    asyncio.run(handler.handle_robot_disconnect(robot_client_id))
+    assert handler.queued_controller_spaces == {}
+
+
+def test_robot_disconnect_releases_queued_controllers():
+    handler, connection_manager, robot_client_id = build_handler()
+    for human_id in ["human-1", "human-2", "human-3"]:
+        asyncio.run(handler.handle_control_request(object(), human_id, {}))
+
+    asyncio.run(handler.handle_robot_disconnect(robot_client_id))
+
+    released = {"robot_id": robot_client_id, "reason": "Robot disconnected"}
+    assert connection_manager.sent_to_client[-3:] == [
+        ("human-1", "control_released", released),
+        ("human-2", "control_released", released),
+        ("human-3", "control_released", released),
+    ]
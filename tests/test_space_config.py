@@ -2,22 +2,19 @@
 Tests for space configuration loading and validation
 """
 
-import os
-import tempfile
 import pytest
-from pathlib import Path
 
 from src.commons.space_config import (
     load_spaces_config,
+    parse_spaces_config,
     SpaceConfig,
-    SpacesConfiguration,
 )
 
 
-@pytest.fixture
-def valid_config_file():
-    """Create a temporary valid configuration file"""
-    config_content = """
+@pytest.fixture(scope="module")
+def valid_config_yaml():
+    """A valid configuration"""
+    return """
 version: "1.0.0"
 default_image_url: "/images/default.jpg"
 spaces:
@@ -33,20 +30,18 @@ spaces:
     max_participants: 3
     enabled: false
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(config_content)
-        temp_path = f.name
 
-    yield temp_path
 
-    # Cleanup
-    os.unlink(temp_path)
+@pytest.fixture(scope="module")
+def valid_config(valid_config_yaml):
+    """The valid configuration, parsed once for the read-only tests"""
+    return parse_spaces_config(valid_config_yaml)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_without_image_url():
-    """Create a config file with space missing image_url"""
-    config_content = """
+    """A config with a space missing image_url"""
+    return """
 version: "1.0.0"
 default_image_url: "/images/default.jpg"
 spaces:
@@ -56,19 +51,12 @@ spaces:
     max_participants: 2
     enabled: true
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(config_content)
-        temp_path = f.name
 
-    yield temp_path
 
-    os.unlink(temp_path)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def invalid_config_duplicate_ids():
-    """Create a config file with duplicate space IDs"""
-    config_content = """
+    """A config with duplicate space IDs"""
+    return """
 version: "1.0.0"
 default_image_url: "/images/default.jpg"
 spaces:
@@ -83,18 +71,14 @@ spaces:
     max_participants: 2
     enabled: true
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(config_content)
-        temp_path = f.name
-
-    yield temp_path
 
-    os.unlink(temp_path)
 
-
-def test_load_valid_config(valid_config_file):
+def test_load_valid_config(valid_config_yaml, tmp_path):
     """Test loading a valid configuration file"""
-    config = load_spaces_config(valid_config_file)
+    config_path = tmp_path / "portalbot_spaces.yml"
+    config_path.write_text(valid_config_yaml)
+
+    config = load_spaces_config(str(config_path))
 
     assert config.version == "1.0.0"
     assert config.default_image_url == "/images/default.jpg"
@@ -116,7 +100,7 @@ def test_load_config_file_not_found():
 
 def test_load_config_with_default_image(config_without_image_url):
     """Test that default image URL is applied when not specified"""
-    config = load_spaces_config(config_without_image_url)
+    config = parse_spaces_config(config_without_image_url)
 
     space = config.spaces[0]
     assert space.image_url == "/images/default.jpg"
@@ -125,65 +109,44 @@ def test_load_config_with_default_image(config_without_image_url):
 def test_load_config_with_duplicate_ids(invalid_config_duplicate_ids):
     """Test that duplicate space IDs are rejected"""
     with pytest.raises(ValueError, match="Space IDs must be unique"):
-        load_spaces_config(invalid_config_duplicate_ids)
+        parse_spaces_config(invalid_config_duplicate_ids)
 
 
 def test_invalid_yaml():
     """Test loading invalid YAML"""
-    config_content = "invalid: yaml: content: ["
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(config_content)
-        temp_path = f.name
-
-    try:
-        with pytest.raises(ValueError, match="Invalid YAML"):
-            load_spaces_config(temp_path)
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(ValueError, match="Invalid YAML"):
+        parse_spaces_config("invalid: yaml: content: [")
 
 
 def test_empty_config_file():
     """Test loading an empty configuration file"""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write("")
-        temp_path = f.name
-
-    try:
-        with pytest.raises(ValueError, match="Configuration file is empty"):
-            load_spaces_config(temp_path)
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(ValueError, match="Configuration file is empty"):
+        parse_spaces_config("")
 
 
-def test_get_space_by_id(valid_config_file):
+def test_get_space_by_id(valid_config):
     """Test getting a space by ID"""
-    config = load_spaces_config(valid_config_file)
-
-    space = config.get_space_by_id("test-space-1")
+    space = valid_config.get_space_by_id("test-space-1")
     assert space is not None
     assert space.id == "test-space-1"
     assert space.display_name == "Test Space 1"
 
     # Test non-existent space
-    space = config.get_space_by_id("nonexistent")
+    space = valid_config.get_space_by_id("nonexistent")
     assert space is None
 
 
-def test_get_enabled_spaces(valid_config_file):
+def test_get_enabled_spaces(valid_config):
     """Test filtering enabled spaces"""
-    config = load_spaces_config(valid_config_file)
-
-    enabled = config.get_enabled_spaces()
+    enabled = valid_config.get_enabled_spaces()
     assert len(enabled) == 1
     assert enabled[0].id == "test-space-1"
     assert enabled[0].enabled is True
 
 
-def test_to_dict(valid_config_file):
+def test_to_dict(valid_config):
     """Test converting spaces configuration to dictionary"""
-    config = load_spaces_config(valid_config_file)
-
-    data = config.to_dict()
+    data = valid_config.to_dict()
 
     assert data["version"] == "1.0.0"
     assert len(data["spaces"]) == 2
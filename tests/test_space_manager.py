@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+from src.server.space_manager import SpaceManager
+
+
+class FakeConnectionManager:
+    def __init__(self):
+        self.client_spaces = {}
+        self.sent_payloads = []
+
+    def get_client_space(self, client_id):
+        return self.client_spaces.get(client_id)
+
+    def set_client_space(self, client_id, space_name):
+        self.client_spaces[client_id] = space_name
+
+    async def send_payload(self, websocket, payload, droppable=False):
+        self.sent_payloads.append((websocket, json.loads(payload)))
+
+
+class FakeSpacesConfig:
+    def get_enabled_spaces(self):
+        return []
+
+
+def build_space_manager():
+    connection_manager = FakeConnectionManager()
+    space_manager = SpaceManager(FakeSpacesConfig(), connection_manager)
+    space_manager.active_spaces["space-a"] = {
+        "human-1": "ws-human-1",
+        "human-2": "ws-human-2",
+        "robot-client": "ws-robot-client",
+    }
+    return space_manager, connection_manager
+
+
+def test_broadcast_excludes_sender():
+    space_manager, connection_manager = build_space_manager()
+
+    asyncio.run(
+        space_manager.broadcast_to_space(
+            "space-a", "ice_candidate", {"candidate": "c"}, exclude_client_id="human-1"
+        )
+    )
+
+    recipients = sorted(websocket for websocket, _ in connection_manager.sent_payloads)
+    assert recipients == ["ws-human-2", "ws-robot-client"]
+    for _websocket, message in connection_manager.sent_payloads:
+        assert message == {"type": "ice_candidate", "data": {"candidate": "c"}}
+
+
+def test_broadcast_to_unknown_space_sends_nothing():
+    space_manager, connection_manager = build_space_manager()
+
+    asyncio.run(space_manager.broadcast_to_space("space-b", "user_left", {}))
+
+    assert connection_manager.sent_payloads == []
+
+
+def test_broadcast_with_only_sender_sends_nothing():
+    space_manager, connection_manager = build_space_manager()
+    space_manager.active_spaces["space-a"] = {"human-1": "ws-human-1"}
+
+    asyncio.run(
+        space_manager.broadcast_to_space(
+            "space-a", "user_left", {}, exclude_client_id="human-1"
+        )
+    )
+
+    assert connection_manager.sent_payloads == []
+
+
+def test_leave_space_notifies_remaining_participants():
+    space_manager, connection_manager = build_space_manager()
+    connection_manager.set_client_space("human-1", "space-a")
+
+    asyncio.run(space_manager.leave_space("human-1"))
+
+    assert set(space_manager.get_space_participants("space-a")) == {
+        "human-2",
+        "robot-client",
+    }
+    assert connection_manager.get_client_space("human-1") is None
+    messages = [message for _websocket, message in connection_manager.sent_payloads]
+    assert messages == [{"type": "user_left", "data": {"participants": 2}}] * 2
+
+
+def test_last_participant_leaving_removes_space():
+    space_manager, connection_manager = build_space_manager()
+    space_manager.active_spaces["space-a"] = {"human-1": "ws-human-1"}
+    connection_manager.set_client_space("human-1", "space-a")
+
+    asyncio.run(space_manager.leave_space("human-1"))
+
+    assert "space-a" not in space_manager.active_spaces
+    assert connection_manager.sent_payloads == []
@@ -1,6 +1,6 @@
 import asyncio
 
-from src.server.webrtc_signaling import WebRTCSignaling
+from src.server.webrtc_signaling import ICE_BATCH_WINDOW_SECONDS, WebRTCSignaling
 
 
 class FakeConnectionManager:
@@ -22,6 +22,12 @@ class FakeConnectionManager:
     def is_robot(self, client_id):
         return client_id in self.robot_clients
 
+    def get_robot_client_for_space(self, space_name):
+        for robot_id, robot_info in self.robot_clients.items():
+            if robot_info.get("space") == space_name:
+                return robot_id
+        return None
+
     async def send_to_client(self, client_id, message_type, data):
         self.sent_to_client.append((client_id, message_type, data))
 
@@ -34,6 +40,16 @@ class FakeSpaceManager:
         raise AssertionError("control routing should not use broadcast")
 
 
+class RecordingSpaceManager:
+    def __init__(self):
+        self.broadcasts = []
+
+    async def broadcast_to_space(
+        self, space_name, message_type, data, exclude_client_id=None
+    ):
+        self.broadcasts.append((space_name, message_type, data, exclude_client_id))
+
+
 def build_signaling():
     connection_manager = FakeConnectionManager()
     connection_manager.robot_clients["robot-client"] = {
@@ -48,6 +64,14 @@ def build_signaling():
     return signaling, connection_manager
 
 
+def build_ice_signaling():
+    connection_manager = FakeConnectionManager()
+    connection_manager.client_spaces["human-1"] = "space-a"
+    space_manager = RecordingSpaceManager()
+    signaling = WebRTCSignaling(connection_manager, space_manager)
+    return signaling, space_manager
+
+
 def test_control_offer_requires_active_controller():
     signaling, connection_manager = build_signaling()
 
@@ -123,3 +147,58 @@ def test_control_answer_routes_only_to_active_controller():
             {"answer": "fake-answer", "sid": "robot-client"},
         )
     ]
+
+
+def test_single_ice_candidate_is_forwarded_unbatched():
+    signaling, space_manager = build_ice_signaling()
+
+    async def run():
+        await signaling.handle_ice_candidate(object(), "human-1", {"candidate": "c1"})
+        assert "human-1" in signaling.ice_flush_tasks
+        await asyncio.sleep(ICE_BATCH_WINDOW_SECONDS * 5)
+
+    asyncio.run(run())
+
+    assert space_manager.broadcasts == [
+        ("space-a", "ice_candidate", {"candidate": "c1", "sid": "human-1"}, "human-1")
+    ]
+    assert signaling.ice_flush_tasks == {}
+
+
+def test_buffered_ice_candidates_are_forwarded_as_one_batch():
+    signaling, space_manager = build_ice_signaling()
+
+    async def run():
+        for candidate in ["c1", "c2", "c3"]:
+            await signaling.handle_ice_candidate(
+                object(), "human-1", {"candidate": candidate}
+            )
+            # Candidates arrive in separate frames, i.e. separate loop ticks
+            await asyncio.sleep(0)
+        await asyncio.sleep(ICE_BATCH_WINDOW_SECONDS * 5)
+
+    asyncio.run(run())
+
+    assert space_manager.broadcasts == [
+        (
+            "space-a",
+            "ice_candidate_batch",
+            {"candidates": ["c1", "c2", "c3"], "sid": "human-1"},
+            "human-1",
+        )
+    ]
+
+
+def test_disconnect_cancels_buffered_ice_candidates():
+    signaling, space_manager = build_ice_signaling()
+
+    async def run():
+        await signaling.handle_ice_candidate(object(), "human-1", {"candidate": "c1"})
+        signaling.cancel_ice_candidates("human-1")
+        await asyncio.sleep(ICE_BATCH_WINDOW_SECONDS * 5)
+
+    asyncio.run(run())
+
+    assert space_manager.broadcasts == []
+    assert signaling.pending_ice_candidates == {}
+    assert signaling.ice_flush_tasks == {}
@@ -9,6 +9,7 @@ import { useCallback, useEffect, useRef, useState } from "react";
 import type {
     ConnectionStatus,
     ErrorData,
+    IceCandidateBatchData,
     JoinSpaceData,
     WebRTCMessage,
 } from "@/types/webrtc";
@@ -193,6 +194,14 @@ export function useWebRTC(): UseWebRTCReturn {
                     void handleIceCandidate(data);
                     break;
 
+                case "ice_candidate_batch": {
+                    const { candidates, sid } = data as IceCandidateBatchData;
+                    for (const candidate of candidates) {
+                        void handleIceCandidate({ candidate, sid });
+                    }
+                    break;
+                }
+
                 case "servo_config":
                     handleServoConfigUpdate(data.servos as Array<IServoConfig>);
                     break;
@@ -136,15 +136,22 @@ export function useSignalingSocket({ showError }: UseSignalingSocketOptions): {
 
         nextWs.onmessage = (event) => {
             try {
-                const message = JSON.parse(event.data) as WebRTCMessage;
-
-                if (message.type === "connected") {
-                    const connectedData = message.data as ConnectedData;
-                    setClientId(connectedData.sid);
-                    console.log("Client ID:", connectedData.sid);
+                const parsed = JSON.parse(event.data) as WebRTCMessage;
+                // The server merges queued messages into one batch frame
+                const messages =
+                    parsed.type === "batch"
+                        ? (parsed.data as Array<WebRTCMessage>)
+                        : [parsed];
+
+                for (const message of messages) {
+                    if (message.type === "connected") {
+                        const connectedData = message.data as ConnectedData;
+                        setClientId(connectedData.sid);
+                        console.log("Client ID:", connectedData.sid);
+                    }
+
+                    messageHandlerRef.current?.(message);
                 }
-
-                messageHandlerRef.current?.(message);
             } catch (err) {
                 console.error("Failed to parse message:", err);
             }
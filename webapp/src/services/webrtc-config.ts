@@ -41,6 +41,9 @@ export const MEDIA_CONSTRAINTS: MediaStreamConstraints = {
     video: {
         width: { ideal: 1280 },
         height: { ideal: 720 },
+        // The robot's display renders at most 30 fps; don't encode and send
+        // frames it will drop anyway.
+        frameRate: { ideal: 30, max: 30 },
     },
     audio: {
         echoCancellation: true,
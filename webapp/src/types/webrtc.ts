@@ -44,6 +44,11 @@ export interface IceCandidateData {
     sid: string;
 }
 
+export interface IceCandidateBatchData {
+    candidates: Array<RTCIceCandidateInit>;
+    sid: string;
+}
+
 export interface ErrorData {
     message: string;
 }